@@ -33,6 +33,7 @@ class BaseAgent(ABC):
         self.mock_mode = mock_mode or os.getenv("MOCK_LLM", "").lower() == "true"
 
         self.client = None
+        self._prompt_enhancer = None
 
         # Only initialize client if not in mock mode
         if not self.mock_mode:
@@ -58,22 +59,49 @@ class BaseAgent(ABC):
         """Name of this agent for logging."""
         pass
 
+    def _get_prompt_enhancer(self):
+        """Return this agent's PromptEnhancer, creating it on first use."""
+        # Reuse one enhancer so its prompt cache survives across calls
+        if self._prompt_enhancer is None:
+            from ..feedback import PromptEnhancer
+            self._prompt_enhancer = PromptEnhancer()
+        return self._prompt_enhancer
+
+    def _feedback_item_type(self) -> str:
+        """Get item type from agent name (e.g., "BlockerDetector" -> "blocker")."""
+        if "Blocker" in self.agent_name:
+            return "blocker"
+        elif "Decision" in self.agent_name:
+            return "decision"
+        elif "Extractor" in self.agent_name or "Update" in self.agent_name:
+            return "update"
+        return ""
+
+    def prefetch_feedback_instructions(self, team_names: list[str]):
+        """
+        Start loading feedback instructions for upcoming teams in the background.
+
+        Call at the start of a run so directive reads overlap with earlier
+        LLM calls instead of sitting in front of each prompt build.
+        """
+        if self.mock_mode:
+            return
+        try:
+            enhancer = self._get_prompt_enhancer()
+            item_type = self._feedback_item_type()
+            for team_name in team_names:
+                enhancer.prefetch(team_name, item_type)
+        except Exception as e:
+            # Prefetch is only an optimization; prompts read directives directly
+            logger.debug(f"{self.agent_name}: feedback prefetch failed: {e}")
+
     def _get_feedback_instructions(self, team_name: str = "") -> str:
         """Get feedback-based instructions to enhance the prompt."""
         try:
-            from ..feedback import PromptEnhancer
-            enhancer = PromptEnhancer()
-
-            # Get item type from agent name (e.g., "BlockerDetector" -> "blocker")
-            item_type = ""
-            if "Blocker" in self.agent_name:
-                item_type = "blocker"
-            elif "Decision" in self.agent_name:
-                item_type = "decision"
-            elif "Extractor" in self.agent_name or "Update" in self.agent_name:
-                item_type = "update"
-
-            return enhancer.get_prompt_instructions(team=team_name, item_type=item_type)
+            enhancer = self._get_prompt_enhancer()
+            return enhancer.get_prompt_instructions(
+                team=team_name, item_type=self._feedback_item_type()
+            )
         except Exception:
             return ""
 
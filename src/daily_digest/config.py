@@ -34,6 +34,18 @@ class DigestConfig:
     chat_model: str = "gpt-4.1"
     temperature: float = 0.3
     
+    # LLM request limits (rate_limit_rpm <= 0 disables pacing)
+    max_concurrent_llm: int = 4
+    rate_limit_rpm: int = 60
+    
+    def __post_init__(self):
+        # A zero-slot semaphore would never admit a call and hang the run
+        if self.max_concurrent_llm < 1:
+            raise ValueError(
+                f"max_concurrent_llm must be at least 1 (MAX_CONCURRENT_LLM), "
+                f"got {self.max_concurrent_llm}"
+            )
+    
     @classmethod
     def from_env(cls) -> "DigestConfig":
         """Load configuration from environment variables."""
@@ -54,6 +66,8 @@ class DigestConfig:
             max_summary_length=int(os.getenv("MAX_SUMMARY_LENGTH", "500")),
             chat_model=os.getenv("CHAT_MODEL", "gpt-4.1"),
             temperature=float(os.getenv("TEMPERATURE", "0.3")),
+            max_concurrent_llm=int(os.getenv("MAX_CONCURRENT_LLM", "4")),
+            rate_limit_rpm=int(os.getenv("LLM_RATE_LIMIT_RPM", "60")),
         )
 
 
@@ -494,8 +494,11 @@ class DigestDistributor:
         """
         run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Get header
-        header_text, header_blocks = self.formatter.format_header_message(output, team_analyses)
+        # Get header (totals are shared with the legacy main digest below)
+        totals = self.formatter.compute_totals(team_analyses)
+        header_text, header_blocks = self.formatter.format_header_message(
+            output, team_analyses, totals
+        )
 
         # Get items grouped by confidence
         high_conf, low_conf, excluded = self.formatter.format_digest_items(
@@ -503,7 +506,7 @@ class DigestDistributor:
         )
 
         # Legacy format for backward compatibility
-        text, blocks = self.formatter.format_main_digest(output, team_analyses)
+        text, blocks = self.formatter.format_main_digest(output, team_analyses, totals)
 
         team_details = {}
         for team_name, ta in team_analyses.items():
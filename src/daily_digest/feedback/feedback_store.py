@@ -401,22 +401,68 @@ class FeedbackStore:
                 return cursor.lastrowid
             return 0
     
-    def get_active_directives(self, team: str, max_count: int = 12, expiry_days: int = 14) -> list[str]:
+    def add_directives(self, team: str, directives: list[str]) -> int:
+        """
+        Add or reconfirm several directives for a team in one transaction.
+        
+        Same semantics as add_directive, but issued as a single upsert batch.
+        Returns the number of directives written.
+        """
+        if not directives:
+            return 0
+        now = datetime.now().isoformat()
+        rows = [(team, directive, now, now) for directive in directives]
+        with self._get_conn() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO prompt_patches (team, directive, created_at, last_confirmed_at, active)
+                VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT(team, directive) DO UPDATE SET
+                    last_confirmed_at = excluded.last_confirmed_at,
+                    confirmation_count = confirmation_count + 1,
+                    active = 1
+            """, rows)
+        return len(rows)
+    
+    def get_active_directives(
+        self,
+        team: str,
+        max_count: int = 12,
+        expiry_days: int = 14,
+        keywords: Optional[list[str]] = None,
+    ) -> list[str]:
         """
         Get active, non-expired directives for a team.
         Returns at most max_count directives, prioritized by confirmation count.
+        If keywords are given, only directives containing at least one of them
+        (case-insensitive) are returned; the limit applies after filtering.
         """
         cutoff = (datetime.now() - timedelta(days=expiry_days)).isoformat()
+        keyword_clause = ""
+        params: list = [team, cutoff]
+        if keywords:
+            keyword_clause = "AND (" + " OR ".join(
+                ["directive LIKE ? ESCAPE '\\'"] * len(keywords)
+            ) + ")"
+            params.extend(f"%{self._escape_like(kw)}%" for kw in keywords)
+        params.append(max_count)
+        
         with self._get_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT directive FROM prompt_patches 
                 WHERE team = ? AND active = 1 AND last_confirmed_at >= ?
+                {keyword_clause}
                 ORDER BY confirmation_count DESC, last_confirmed_at DESC
                 LIMIT ?
-            """, (team, cutoff, max_count))
+            """, params)
             return [row["directive"] for row in cursor.fetchall()]
     
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escape LIKE wildcards so keywords match literally."""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    
     def expire_old_directives(self, expiry_days: int = 14):
         """Mark old directives as inactive."""
         cutoff = (datetime.now() - timedelta(days=expiry_days)).isoformat()
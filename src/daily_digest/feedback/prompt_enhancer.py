@@ -1,14 +1,45 @@
 """Prompt Enhancer - generates bounded, expiring prompt directives from feedback patterns."""
 
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from dataclasses import dataclass
+from itertools import chain
 from datetime import datetime, timedelta
 from typing import Optional
-from collections import defaultdict
 
-from .feedback_store import FeedbackStore, FeedbackEvent
+from ..observability import logger
+from .feedback_store import FeedbackStore
 
 
-@dataclass
+def _norm(directive: str) -> str:
+    """Normalize a directive for case-insensitive dedup."""
+    return directive.lower().strip()
+
+
+# Shared by all enhancers; directive reads are small, so two workers suffice
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Lazily create the shared prefetch thread pool."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="directive-prefetch"
+        )
+    return _prefetch_executor
+
+
+@lru_cache(maxsize=256)
+def _format_bullets(directives: tuple[str, ...]) -> str:
+    """Format directives as prompt bullets (memoized; directive sets repeat)."""
+    return "\n".join(f"- {d}" for d in directives)
+
+
+@dataclass(slots=True, frozen=True)
 class DirectiveCandidate:
     """A candidate directive with scoring."""
     directive: str
@@ -32,6 +63,14 @@ class PromptEnhancer:
     EXPIRY_DAYS = 14     # Expire unless reconfirmed
     ROTATION_DAYS = 7    # Weekly rotation for new analysis
     
+    # Formatted prompt text is memoized per (team, item_type) until a write
+    # invalidates it or the TTL lapses (other processes may write the store)
+    PROMPT_CACHE_TTL_SECONDS = 300
+    PROMPT_CACHE_SIZE = 128
+    
+    # Minimum gap between expiry sweeps; reads already filter by expiry_days
+    EXPIRE_SWEEP_INTERVAL_SECONDS = 600
+    
     # Heuristic templates for common failure patterns
     DIRECTIVE_TEMPLATES = {
         "wrong_decision": "Do not label as a decision unless explicit approval language exists (e.g., 'approved', 'decided', 'agreed').",
@@ -44,11 +83,41 @@ class PromptEnhancer:
         "wrong_severity": "Reserve 'high' severity for items that block critical path or have deadline implications.",
     }
     
+    # Template key -> (feedback_type, item_type, min_count) conditions; any match fires
+    PATTERN_RULES: tuple[tuple[str, tuple[tuple[str, str, int], ...]], ...] = (
+        ("wrong_decision", (("wrong", "decision", 2),)),
+        ("wrong_blocker", (("wrong", "blocker", 2),)),
+        ("wrong_owner", (("wrong", "update", 3),)),
+        ("missing_context_decision", (("missing_context", "decision", 2),)),
+        ("missing_context_blocker", (("missing_context", "blocker", 2),)),
+        ("irrelevant_update", (("irrelevant", "update", 3),)),
+        ("irrelevant_fyi", (("irrelevant", "fyi", 2),)),
+        ("wrong_severity", (("wrong", "blocker", 2), ("wrong", "risk", 2))),
+    )
+    
+    # Keywords used to match directives to an item type
+    TYPE_KEYWORDS = {
+        "blocker": ("blocker", "blocking", "blocked"),
+        "decision": ("decision", "decided", "approval"),
+        "update": ("update", "status", "progress"),
+        "action_item": ("action", "task", "owner"),
+    }
+    
     def __init__(self, store: Optional[FeedbackStore] = None, use_llm: bool = False):
         if store is None:
             store = FeedbackStore()
         self.store = store
         self.use_llm = use_llm
+        
+        self._prompt_cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+        self._cache_version = 0
+        self._last_expire_ts: Optional[float] = None
+        # (team, item_type) -> (cache version at submit time, in-flight read)
+        self._pending: dict[tuple[str, str], tuple[int, Future]] = {}
+        # One enhancer is shared by agents running in worker threads; guards
+        # the prompt cache, _pending, the cache version and the sweep timestamp.
+        # Never held across store reads or while waiting on a prefetch.
+        self._lock = threading.Lock()
     
     def generate_directives(self, team: str) -> str:
         """
@@ -56,8 +125,8 @@ class PromptEnhancer:
         
         Returns formatted directive bullets ready for prompt injection.
         """
-        # First, expire old directives
-        self.store.expire_old_directives(self.EXPIRY_DAYS)
+        # First, expire old directives (throttled)
+        self._maybe_expire_directives()
         
         # Get existing active directives
         existing = self.store.get_active_directives(team, self.MAX_DIRECTIVES, self.EXPIRY_DAYS)
@@ -65,18 +134,38 @@ class PromptEnhancer:
         # Analyze recent feedback for new patterns
         new_directives = self._analyze_feedback_patterns(team)
         
+        existing_norm = frozenset(_norm(d) for d in existing)
+        
         # Merge and dedupe
         all_directives = self._merge_directives(existing, new_directives)
         
         # Store new ones for persistence
-        for directive in new_directives:
-            if directive not in existing:
-                self.store.add_directive(team, directive)
+        if self.store.add_directives(
+            team, [d for d in new_directives if _norm(d) not in existing_norm]
+        ):
+            self._invalidate_cache()
         
         # Format as bullets
-        if all_directives:
-            return "\n".join(f"- {d}" for d in all_directives[:self.MAX_DIRECTIVES])
-        return ""
+        return _format_bullets(tuple(all_directives[:self.MAX_DIRECTIVES]))
+    
+    def _maybe_expire_directives(self):
+        """
+        Run the expiry sweep at most once per EXPIRE_SWEEP_INTERVAL_SECONDS.
+        
+        Expired rows are already excluded by get_active_directives, so a
+        delayed sweep only defers the bookkeeping UPDATE.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._last_expire_ts is not None
+                and now - self._last_expire_ts < self.EXPIRE_SWEEP_INTERVAL_SECONDS
+            ):
+                return
+            self._last_expire_ts = now
+        
+        if self.store.expire_old_directives(self.EXPIRY_DAYS):
+            self._invalidate_cache()
     
     def _analyze_feedback_patterns(self, team: str) -> list[str]:
         """
@@ -84,93 +173,41 @@ class PromptEnhancer:
         
         Uses heuristics for PoC; can be extended with LLM for production.
         """
-        candidates = []
-        
         # Get recent feedback with associated items
         recent_feedback = self.store.get_recent_feedback(days=self.ROTATION_DAYS, team=team)
+        items_by_id = {
+            item.digest_item_id: item
+            for item in self.store.get_recent_items(days=30)
+        }
         
-        # Group feedback by type and analyze patterns
-        wrong_items: list[tuple[FeedbackEvent, str]] = []
-        missing_context_items: list[tuple[FeedbackEvent, str]] = []
-        irrelevant_items: list[tuple[FeedbackEvent, str]] = []
-        
+        # Count feedback by (feedback_type, item_type) in a single pass
+        counts: Counter[tuple[str, str]] = Counter()
         for fb in recent_feedback:
-            # Get the associated item to understand what was marked wrong
-            items = self.store.get_items_by_run("")  # We need item details
-            item = next((i for i in self.store.get_recent_items(days=30) 
-                        if i.digest_item_id == fb.digest_item_id), None)
-            
-            if not item:
-                continue
-            
-            if fb.feedback_type == "wrong":
-                wrong_items.append((fb, item.item_type))
-            elif fb.feedback_type == "missing_context":
-                missing_context_items.append((fb, item.item_type))
-            elif fb.feedback_type == "irrelevant":
-                irrelevant_items.append((fb, item.item_type))
-        
-        # Generate directives based on patterns
-        wrong_by_type = defaultdict(int)
-        for fb, item_type in wrong_items:
-            wrong_by_type[item_type] += 1
-        
-        missing_by_type = defaultdict(int)
-        for fb, item_type in missing_context_items:
-            missing_by_type[item_type] += 1
-        
-        irrelevant_by_type = defaultdict(int)
-        for fb, item_type in irrelevant_items:
-            irrelevant_by_type[item_type] += 1
+            item = items_by_id.get(fb.digest_item_id)
+            if item:
+                counts[(fb.feedback_type, item.item_type)] += 1
         
         # Apply heuristic templates
-        if wrong_by_type.get("decision", 0) >= 2:
-            candidates.append(self.DIRECTIVE_TEMPLATES["wrong_decision"])
-        
-        if wrong_by_type.get("blocker", 0) >= 2:
-            candidates.append(self.DIRECTIVE_TEMPLATES["wrong_blocker"])
-        
-        if wrong_by_type.get("update", 0) >= 3:
-            candidates.append(self.DIRECTIVE_TEMPLATES["wrong_owner"])
-        
-        if missing_by_type.get("decision", 0) >= 2:
-            candidates.append(self.DIRECTIVE_TEMPLATES["missing_context_decision"])
-        
-        if missing_by_type.get("blocker", 0) >= 2:
-            candidates.append(self.DIRECTIVE_TEMPLATES["missing_context_blocker"])
-        
-        if irrelevant_by_type.get("update", 0) >= 3:
-            candidates.append(self.DIRECTIVE_TEMPLATES["irrelevant_update"])
-        
-        if irrelevant_by_type.get("fyi", 0) >= 2:
-            candidates.append(self.DIRECTIVE_TEMPLATES["irrelevant_fyi"])
-        
-        # Check for severity issues
-        if wrong_by_type.get("blocker", 0) >= 2 or wrong_by_type.get("risk", 0) >= 2:
-            candidates.append(self.DIRECTIVE_TEMPLATES["wrong_severity"])
+        candidates = [
+            self.DIRECTIVE_TEMPLATES[template_key]
+            for template_key, conditions in self.PATTERN_RULES
+            if any(counts[(fb_type, item_type)] >= threshold
+                   for fb_type, item_type, threshold in conditions)
+        ]
         
         return candidates
     
     def _merge_directives(self, existing: list[str], new: list[str]) -> list[str]:
         """Merge existing and new directives, removing duplicates."""
-        seen = set()
-        merged = []
-        
-        # Existing directives first (already prioritized by confirmation count)
-        for d in existing:
-            normalized = d.lower().strip()
-            if normalized not in seen:
-                seen.add(normalized)
-                merged.append(d)
-        
-        # Then new ones
-        for d in new:
-            normalized = d.lower().strip()
-            if normalized not in seen:
-                seen.add(normalized)
-                merged.append(d)
-        
-        return merged[:self.MAX_DIRECTIVES]
+        # Normalized key -> first original spelling; dicts keep insertion order.
+        # Existing directives go first (already prioritized by confirmation count).
+        merged: dict[str, str] = {}
+        for d in chain(existing, new):
+            merged.setdefault(_norm(d), d)
+            if len(merged) >= self.MAX_DIRECTIVES:
+                break
+        
+        return list(merged.values())
     
     def get_active_patches(self, team: str) -> str:
         """
@@ -178,15 +215,20 @@ class PromptEnhancer:
         
         This is the main interface used by TeamAnalyzerAgent.
         """
+        key = ("patches", team, "", self._cache_version)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         directives = self.store.get_active_directives(
             team, 
             max_count=self.MAX_DIRECTIVES,
             expiry_days=self.EXPIRY_DAYS
         )
         
-        if directives:
-            return "\n".join(f"- {d}" for d in directives)
-        return ""
+        result = _format_bullets(tuple(directives))
+        self._cache_put(key, result)
+        return result
     
     def confirm_directive(self, team: str, directive: str):
         """
@@ -195,10 +237,12 @@ class PromptEnhancer:
         This extends the directive's lifespan.
         """
         self.store.add_directive(team, directive)
+        self._invalidate_cache()
     
     def force_expire(self, team: str, directive: str):
         """Manually expire a specific directive."""
         self.store.deactivate_directive(team, directive)
+        self._invalidate_cache()
     
     def get_prompt_instructions(self, team: str = "", item_type: str = "") -> str:
         """
@@ -216,32 +260,107 @@ class PromptEnhancer:
         if not team:
             return ""
         
+        key = ("instructions", team, item_type, self._cache_version)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._take_prefetched(team, item_type)
+        if result is None:
+            result = self._build_prompt_instructions(team, item_type)
+        self._cache_put(key, result)
+        return result
+    
+    def prefetch(self, team: str, item_type: str = ""):
+        """
+        Start reading a team's prompt instructions in the background.
+        
+        A later get_prompt_instructions call for the same (team, item_type)
+        picks up the result instead of querying the store itself.
+        """
+        if not team:
+            return
+        with self._lock:
+            if (team, item_type) in self._pending:
+                return
+            version = self._cache_version
+        if self._cache_get(("instructions", team, item_type, version)) is not None:
+            return
+        
+        with self._lock:
+            # Another thread may have submitted (or written) in the meantime
+            if (team, item_type) in self._pending or version != self._cache_version:
+                return
+            future = _get_prefetch_executor().submit(
+                self._build_prompt_instructions, team, item_type
+            )
+            self._pending[(team, item_type)] = (version, future)
+    
+    def _take_prefetched(self, team: str, item_type: str) -> Optional[str]:
+        """Return a prefetched result, or None if absent, stale, or failed."""
+        with self._lock:
+            pending = self._pending.pop((team, item_type), None)
+            current_version = self._cache_version
+        if pending is None:
+            return None
+        
+        version, future = pending
+        if version != current_version:
+            future.cancel()
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.debug(f"Directive prefetch for {team!r} failed, reading directly: {e}")
+            return None
+    
+    def _build_prompt_instructions(self, team: str, item_type: str) -> str:
+        """Read directives from the store and format them for injection."""
+        # Item-type keyword filtering happens in the store query
+        keywords = self.TYPE_KEYWORDS.get(item_type)
         directives = self.store.get_active_directives(
             team,
             max_count=self.MAX_DIRECTIVES,
-            expiry_days=self.EXPIRY_DAYS
+            expiry_days=self.EXPIRY_DAYS,
+            keywords=list(keywords) if keywords else None,
         )
         
-        if not directives:
-            return ""
-        
-        # Filter by item type if specified
-        if item_type:
-            type_keywords = {
-                "blocker": ["blocker", "blocking", "blocked"],
-                "decision": ["decision", "decided", "approval"],
-                "update": ["update", "status", "progress"],
-                "action_item": ["action", "task", "owner"],
-            }
-            keywords = type_keywords.get(item_type, [])
-            if keywords:
-                directives = [
-                    d for d in directives 
-                    if any(kw in d.lower() for kw in keywords)
-                ]
-        
         if directives:
-            formatted = "\n".join(f"- {d}" for d in directives)
+            formatted = _format_bullets(tuple(directives))
             return f"\n\n## Quality rules from user feedback (apply these):\n{formatted}"
         return ""
+    
+    # ==================== Prompt Cache ====================
+    
+    def _cache_get(self, key: tuple) -> Optional[str]:
+        """Return a cached prompt string, or None if missing or stale."""
+        with self._lock:
+            entry = self._prompt_cache.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.PROMPT_CACHE_TTL_SECONDS:
+                del self._prompt_cache[key]
+                return None
+            
+            self._prompt_cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, key: tuple, value: str):
+        """Store a prompt string, evicting the least recently used entries."""
+        with self._lock:
+            self._prompt_cache[key] = (time.monotonic(), value)
+            self._prompt_cache.move_to_end(key)
+            while len(self._prompt_cache) > self.PROMPT_CACHE_SIZE:
+                self._prompt_cache.popitem(last=False)
+    
+    def _invalidate_cache(self):
+        """Drop cached prompt text after a directive write."""
+        with self._lock:
+            self._cache_version += 1
+            self._prompt_cache.clear()
+            for _, future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
 
@@ -1,16 +1,40 @@
 """Digest formatter - creates Slack-ready output from V2 DigestOutput."""
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import re
+from dataclasses import dataclass
 from typing import Optional
-import uuid
 
-from .orchestrator import DigestOutput, GlobalDigest
+from .orchestrator import DigestOutput
 from .agents.team_analyzer import TeamAnalysis
-from .models.events import StructuredEvent, Decision, Blocker, StatusUpdate
 
 
-@dataclass
+# Blocker text mentioning another team (substring of the lowercased issue).
+# Lowercasing first and matching case-sensitively is several times faster
+# than an IGNORECASE pattern.
+_CROSS_TEAM_KEYWORDS = ("mechanical", "electrical", "software", "firmware")
+_CROSS_TEAM_RE = re.compile("|".join(map(re.escape, _CROSS_TEAM_KEYWORDS)))
+
+# Feedback emoji guide
+_FEEDBACK_GUIDE = "✅ accurate | ❌ wrong | 🧩 missing context | 🔕 not relevant"
+
+# Context block appended to every item message; shared, never mutated
+_FEEDBACK_CONTEXT_BLOCK = {
+    "type": "context",
+    "elements": [{"type": "mrkdwn", "text": f"_{_FEEDBACK_GUIDE}_"}],
+}
+
+# Static blocks reused across digests; shared, never mutated
+_DIVIDER_BLOCK = {"type": "divider"}
+_DETAILS_CONTEXT_BLOCK = {
+    "type": "context",
+    "elements": [{
+        "type": "mrkdwn",
+        "text": "📋 _Full details posted to each team's channel_"
+    }]
+}
+
+
+@dataclass(slots=True)
 class DigestItemMessage:
     """Individual digest item formatted for Slack posting."""
     digest_item_id: str
@@ -19,7 +43,24 @@ class DigestItemMessage:
     title: str
     confidence: float
     text: str
-    blocks: list[dict] = field(default_factory=list)
+    section_text: str = ""  # mrkdwn body of the item's section block
+    
+    @property
+    def blocks(self) -> list[dict]:
+        """Slack blocks for this item: its section plus the feedback guide."""
+        return [
+            {"type": "section", "text": {"type": "mrkdwn", "text": self.section_text}},
+            _FEEDBACK_CONTEXT_BLOCK,
+        ]
+
+
+@dataclass(slots=True)
+class DigestTotals:
+    """Headline counts shown at the top of the digest."""
+    teams: int = 0
+    messages: int = 0
+    active_blockers: int = 0
+    decisions: int = 0
 
 
 class DigestFormatter:
@@ -43,7 +84,17 @@ class DigestFormatter:
     LOW_CONFIDENCE_THRESHOLD = 0.4
     
     # Feedback emoji guide
-    FEEDBACK_GUIDE = "✅ accurate | ❌ wrong | 🧩 missing context | 🔕 not relevant"
+    FEEDBACK_GUIDE = _FEEDBACK_GUIDE
+    
+    # Item message templates (text line, then section body)
+    _BLOCKER_TEXT_FMT = "{icon} *[{team}] Blocker:* {issue}"
+    _BLOCKER_SECTION_FMT = _BLOCKER_TEXT_FMT + "\n_Owner: {owner}_ | _Severity: {severity}_"
+    _DECISION_TEXT_FMT = "✅ *[{team}] Decision:* {decision}"
+    _DECISION_SECTION_FMT = _DECISION_TEXT_FMT + "\n_Made by: {made_by}_"
+    _UPDATE_TEXT_FMT = "📊 *[{team}] Update:* {update}"
+    _UPDATE_SECTION_FMT = "📊 *[{team}] {category}:* {update}\n_From: {author}_"
+    _ACTION_TEXT_FMT = "📌 *[{team}] Action:* {description}"
+    _ACTION_SECTION_FMT = "{icon} *[{team}] Action:* {description}\n_Owner: {owner}_ | _Priority: {priority}_"
     
     EMOJI_MAP = {
         "mechanical": "⚙️",
@@ -51,6 +102,20 @@ class DigestFormatter:
         "software": "💻",
     }
     
+    # Display titles for known teams; others fall back to str.title()
+    TEAM_TITLE = {team_name: team_name.title() for team_name in EMOJI_MAP}
+    
+    # Severity (blockers) / priority (action items) -> icon; anything else is green
+    SEVERITY_ICON = {
+        "high": "🔴",
+        "medium": "🟡",
+        "low": "🟢",
+    }
+    
+    # Blocker roll-ups (main digest, leadership DM) only flag high severity;
+    # anything else is yellow
+    ALERT_ICON = {"high": "🔴"}
+    
     TONE_EMOJI = {
         "productive": "🚀",
         "collaborative": "🤝",
@@ -84,89 +149,82 @@ class DigestFormatter:
         excluded = []
         
         item_confidences = item_confidences or {}
-        item_idx = 0
         
         for team_name, ta in team_analyses.items():
-            emoji = self.EMOJI_MAP.get(team_name, "📁")
+            id_prefix = f"{run_id}_{team_name}_"
+            # Per-team sublists, indexed by _confidence_bucket() and merged into
+            # the result lists with one extend each; bucket 0 only receives ids
+            routed = ([], [], [])
+            team_excluded = routed[0]
             
             # Process blockers
             for i, b in enumerate(ta.blockers):
-                item_idx += 1
-                item_id = f"{run_id}_{team_name}_blocker_{i}"
+                item_id = f"{id_prefix}blocker_{i}"
                 confidence = item_confidences.get(item_id, 0.9)  # Default high
                 
-                if confidence < self.LOW_CONFIDENCE_THRESHOLD:
-                    excluded.append(item_id)
+                bucket = self._confidence_bucket(confidence)
+                if not bucket:
+                    team_excluded.append(item_id)
                     continue
                 
+                issue = b.get("issue", "")
                 severity = b.get("severity", "medium")
-                icon = "🔴" if severity == "high" else "🟡" if severity == "medium" else "🟢"
+                icon = self.SEVERITY_ICON.get(severity, "🟢")
                 owner = b.get("owner", "TBD")
                 
                 msg = DigestItemMessage(
                     digest_item_id=item_id,
                     team=team_name,
                     item_type="blocker",
-                    title=b.get("issue", ""),
+                    title=issue,
                     confidence=confidence,
-                    text=f"{icon} *[{team_name}] Blocker:* {b.get('issue', '')}",
-                    blocks=[
-                        {"type": "section", "text": {"type": "mrkdwn", 
-                            "text": f"{icon} *[{team_name}] Blocker:* {b.get('issue', '')}\n_Owner: {owner}_ | _Severity: {severity}_"}},
-                        {"type": "context", "elements": [
-                            {"type": "mrkdwn", "text": f"_{self.FEEDBACK_GUIDE}_"}
-                        ]}
-                    ]
+                    text=self._BLOCKER_TEXT_FMT.format(icon=icon, team=team_name, issue=issue),
+                    section_text=self._BLOCKER_SECTION_FMT.format(
+                        icon=icon, team=team_name, issue=issue,
+                        owner=owner, severity=severity,
+                    ),
                 )
                 
-                if confidence >= self.HIGH_CONFIDENCE_THRESHOLD:
-                    high_confidence.append(msg)
-                else:
-                    low_confidence.append(msg)
+                routed[bucket].append(msg)
             
             # Process decisions
             for i, d in enumerate(ta.decisions):
-                item_idx += 1
-                item_id = f"{run_id}_{team_name}_decision_{i}"
+                item_id = f"{id_prefix}decision_{i}"
                 confidence = item_confidences.get(item_id, 0.9)
                 
-                if confidence < self.LOW_CONFIDENCE_THRESHOLD:
-                    excluded.append(item_id)
+                bucket = self._confidence_bucket(confidence)
+                if not bucket:
+                    team_excluded.append(item_id)
                     continue
                 
+                decision = d.get("decision", "")
                 made_by = d.get("made_by", "")
                 
                 msg = DigestItemMessage(
                     digest_item_id=item_id,
                     team=team_name,
                     item_type="decision",
-                    title=d.get("decision", ""),
+                    title=decision,
                     confidence=confidence,
-                    text=f"✅ *[{team_name}] Decision:* {d.get('decision', '')}",
-                    blocks=[
-                        {"type": "section", "text": {"type": "mrkdwn",
-                            "text": f"✅ *[{team_name}] Decision:* {d.get('decision', '')}\n_Made by: {made_by}_"}},
-                        {"type": "context", "elements": [
-                            {"type": "mrkdwn", "text": f"_{self.FEEDBACK_GUIDE}_"}
-                        ]}
-                    ]
+                    text=self._DECISION_TEXT_FMT.format(team=team_name, decision=decision),
+                    section_text=self._DECISION_SECTION_FMT.format(
+                        team=team_name, decision=decision, made_by=made_by,
+                    ),
                 )
                 
-                if confidence >= self.HIGH_CONFIDENCE_THRESHOLD:
-                    high_confidence.append(msg)
-                else:
-                    low_confidence.append(msg)
+                routed[bucket].append(msg)
             
             # Process updates (top 3 only for main digest)
             for i, u in enumerate(ta.updates[:3]):
-                item_idx += 1
-                item_id = f"{run_id}_{team_name}_update_{i}"
+                item_id = f"{id_prefix}update_{i}"
                 confidence = item_confidences.get(item_id, 0.8)
                 
-                if confidence < self.LOW_CONFIDENCE_THRESHOLD:
-                    excluded.append(item_id)
+                bucket = self._confidence_bucket(confidence)
+                if not bucket:
+                    team_excluded.append(item_id)
                     continue
                 
+                update = u.get("update", "")
                 category = u.get("category", "info")
                 author = u.get("author", "")
                 
@@ -174,104 +232,131 @@ class DigestFormatter:
                     digest_item_id=item_id,
                     team=team_name,
                     item_type="update",
-                    title=u.get("update", ""),
+                    title=update,
                     confidence=confidence,
-                    text=f"📊 *[{team_name}] Update:* {u.get('update', '')}",
-                    blocks=[
-                        {"type": "section", "text": {"type": "mrkdwn",
-                            "text": f"📊 *[{team_name}] {category.title()}:* {u.get('update', '')}\n_From: {author}_"}},
-                        {"type": "context", "elements": [
-                            {"type": "mrkdwn", "text": f"_{self.FEEDBACK_GUIDE}_"}
-                        ]}
-                    ]
+                    text=self._UPDATE_TEXT_FMT.format(team=team_name, update=update),
+                    section_text=self._UPDATE_SECTION_FMT.format(
+                        team=team_name, category=category.title(),
+                        update=update, author=author,
+                    ),
                 )
                 
-                if confidence >= self.HIGH_CONFIDENCE_THRESHOLD:
-                    high_confidence.append(msg)
-                else:
-                    low_confidence.append(msg)
+                routed[bucket].append(msg)
             
             # Process action items
             for i, a in enumerate(ta.action_items):
-                item_idx += 1
-                item_id = f"{run_id}_{team_name}_action_{i}"
+                item_id = f"{id_prefix}action_{i}"
                 confidence = item_confidences.get(item_id, 0.85)
                 
-                if confidence < self.LOW_CONFIDENCE_THRESHOLD:
-                    excluded.append(item_id)
+                bucket = self._confidence_bucket(confidence)
+                if not bucket:
+                    team_excluded.append(item_id)
                     continue
                 
+                description = a.get("description", "")
                 priority = a.get("priority", "medium")
-                icon = "🔴" if priority == "high" else "🟡" if priority == "medium" else "🟢"
+                icon = self.SEVERITY_ICON.get(priority, "🟢")
                 owner = a.get("owner", "TBD")
                 
                 msg = DigestItemMessage(
                     digest_item_id=item_id,
                     team=team_name,
                     item_type="action_item",
-                    title=a.get("description", ""),
+                    title=description,
                     confidence=confidence,
-                    text=f"📌 *[{team_name}] Action:* {a.get('description', '')}",
-                    blocks=[
-                        {"type": "section", "text": {"type": "mrkdwn",
-                            "text": f"{icon} *[{team_name}] Action:* {a.get('description', '')}\n_Owner: {owner}_ | _Priority: {priority}_"}},
-                        {"type": "context", "elements": [
-                            {"type": "mrkdwn", "text": f"_{self.FEEDBACK_GUIDE}_"}
-                        ]}
-                    ]
+                    text=self._ACTION_TEXT_FMT.format(team=team_name, description=description),
+                    section_text=self._ACTION_SECTION_FMT.format(
+                        icon=icon, team=team_name, description=description,
+                        owner=owner, priority=priority,
+                    ),
                 )
                 
-                if confidence >= self.HIGH_CONFIDENCE_THRESHOLD:
-                    high_confidence.append(msg)
-                else:
-                    low_confidence.append(msg)
+                routed[bucket].append(msg)
+            
+            excluded.extend(team_excluded)
+            low_confidence.extend(routed[1])
+            high_confidence.extend(routed[2])
         
         return high_confidence, low_confidence, excluded
     
+    def _confidence_bucket(self, confidence: float) -> int:
+        """0 = excluded, 1 = lower confidence / FYI, 2 = main digest."""
+        return (
+            (confidence >= self.LOW_CONFIDENCE_THRESHOLD)
+            + (confidence >= self.HIGH_CONFIDENCE_THRESHOLD)
+        )
+    
+    def _team_title(self, team_name: str) -> str:
+        """Display title for a team name."""
+        return self.TEAM_TITLE.get(team_name) or team_name.title()
+    
+    def _team_meta(self, team_name: str, tone: str) -> tuple[str, str, str]:
+        """(emoji, tone emoji, title) for a team, resolved in one call."""
+        return (
+            self.EMOJI_MAP.get(team_name, "📁"),
+            self.TONE_EMOJI.get(tone, ""),
+            self._team_title(team_name),
+        )
+    
+    def compute_totals(self, team_analyses: dict[str, TeamAnalysis]) -> DigestTotals:
+        """
+        Count teams, messages, active blockers and decisions in one pass.
+        
+        Callers rendering both the header and main digest can compute this
+        once and pass it to each.
+        """
+        totals = DigestTotals(teams=len(team_analyses))
+        for ta in team_analyses.values():
+            totals.messages += ta.message_count
+            totals.active_blockers += sum(1 for b in ta.blockers if b.get("status") != "resolved")
+            totals.decisions += len(ta.decisions)
+        return totals
+    
+    def _header_blocks(self, date: str, totals: DigestTotals) -> list[dict]:
+        """Title and stats blocks shared by the header message and main digest."""
+        return [{
+            "type": "header",
+            "text": {"type": "plain_text", "text": f"📰 Daily Digest - {date}", "emoji": True}
+        }, {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": (
+                f"*{totals.teams} teams* • "
+                f"*{totals.messages} messages* • "
+                f"*{totals.active_blockers} active blockers* • "
+                f"*{totals.decisions} decisions*"
+            )}
+        }]
+    
     def format_header_message(
         self,
         output: DigestOutput,
         team_analyses: dict[str, TeamAnalysis],
+        totals: Optional[DigestTotals] = None,
     ) -> tuple[str, list[dict]]:
         """
         Format the header message summarizing the digest.
         Posted first, before individual items.
         """
         date = output.global_digest.date
+        if totals is None:
+            totals = self.compute_totals(team_analyses)
         
-        total_blockers = sum(
-            len([b for b in ta.blockers if b.get("status") != "resolved"]) 
-            for ta in team_analyses.values()
-        )
-        total_decisions = sum(len(ta.decisions) for ta in team_analyses.values())
-        total_messages = sum(ta.message_count for ta in team_analyses.values())
-        
-        blocks = [{
-            "type": "header",
-            "text": {"type": "plain_text", "text": f"📰 Daily Digest - {date}", "emoji": True}
-        }, {
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": (
-                f"*{len(team_analyses)} teams* • "
-                f"*{total_messages} messages* • "
-                f"*{total_blockers} active blockers* • "
-                f"*{total_decisions} decisions*"
-            )}
-        }, {
-            "type": "divider"
-        }, {
+        blocks = self._header_blocks(date, totals)
+        blocks.append(_DIVIDER_BLOCK)
+        blocks.append({
             "type": "context",
             "elements": [{"type": "mrkdwn", 
                 "text": f"💡 _React to items below:_ {self.FEEDBACK_GUIDE}"}]
-        }]
+        })
         
-        text = f"Daily Digest - {date}: {total_messages} messages"
+        text = f"Daily Digest - {date}: {totals.messages} messages"
         return text, blocks
     
     def format_main_digest(
         self, 
         output: DigestOutput,
         team_analyses: dict[str, TeamAnalysis],
+        totals: Optional[DigestTotals] = None,
     ) -> tuple[str, list[dict]]:
         """
         Format the main digest post for #daily-digest channel.
@@ -279,89 +364,70 @@ class DigestFormatter:
         Args:
             output: DigestOutput from orchestrator
             team_analyses: Dict of team_name -> TeamAnalysis
+            totals: Precomputed totals (see compute_totals); computed if omitted
         
         Returns (text, blocks) for Slack posting.
         """
-        blocks = []
         date = output.global_digest.date
+        if totals is None:
+            totals = self.compute_totals(team_analyses)
         
-        # Header
-        blocks.append({
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": f"📰 Daily Digest - {date}",
-                "emoji": True,
-            }
-        })
-        
-        # Summary stats
-        total_blockers = sum(
-            len([b for b in ta.blockers if b.get("status") != "resolved"]) 
-            for ta in team_analyses.values()
-        )
-        total_decisions = sum(len(ta.decisions) for ta in team_analyses.values())
-        total_messages = sum(ta.message_count for ta in team_analyses.values())
-        
-        stats_text = (
-            f"*{len(team_analyses)} teams* • "
-            f"*{total_messages} messages* • "
-            f"*{total_blockers} active blockers* • "
-            f"*{total_decisions} decisions*"
-        )
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": stats_text}
-        })
-        
-        blocks.append({"type": "divider"})
+        # Single pass over teams: team summaries, blockers and decisions
+        team_blocks = []
+        cross_team_blockers = []
+        key_decisions = []
+        team_meta = self._team_meta
         
-        # Team summaries with brief overview
         for team_name, ta in team_analyses.items():
-            emoji = self.EMOJI_MAP.get(team_name, "📁")
-            tone_emoji = self.TONE_EMOJI.get(ta.tone, "")
+            summary = ta.summary
+            emoji, tone_emoji, title = team_meta(team_name, ta.tone)
             
             # Team header
-            header = f"{emoji} *{team_name.title()}* {tone_emoji}"
+            header = f"{emoji} *{title}* {tone_emoji}"
             
             # Brief summary (first 150 chars)
-            summary = ta.summary[:150] + "..." if len(ta.summary) > 150 else ta.summary
+            summary = summary[:150] + "..." if len(summary) > 150 else summary
             
-            blocks.append({
+            team_blocks.append({
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": f"{header}\n_{summary}_"}
             })
+            
+            # Active blockers that are high severity or mention another team;
+            # each blocker's fields are read once and kept for rendering
+            for b in ta.blockers:
+                if b.get("status") == "resolved":
+                    continue
+                issue = b.get("issue", "")
+                severity = b.get("severity")
+                if severity == "high" or _CROSS_TEAM_RE.search(issue.lower()):
+                    cross_team_blockers.append((team_name, severity, issue))
+            
+            # Key decisions summary
+            for d in ta.decisions[:2]:  # Top 2 per team
+                key_decisions.append((team_name, d.get("decision", "")))
         
-        blocks.append({"type": "divider"})
+        # Header and summary stats
+        blocks = self._header_blocks(date, totals)
         
-        # Cross-team blockers with impact
-        cross_team_blockers = []
-        for team_name, ta in team_analyses.items():
-            for b in ta.blockers:
-                if b.get("status") != "resolved":
-                    issue = b.get("issue", "")
-                    if any(team in issue.lower() for team in ["mechanical", "electrical", "software", "firmware"]):
-                        cross_team_blockers.append((team_name, b, "cross-team"))
-                    elif b.get("severity") == "high":
-                        cross_team_blockers.append((team_name, b, "high"))
+        blocks.append(_DIVIDER_BLOCK)
+        
+        # Team summaries with brief overview
+        blocks.extend(team_blocks)
+        
+        blocks.append(_DIVIDER_BLOCK)
         
         if cross_team_blockers:
             blocker_lines = ["*🚨 Key Blockers Affecting Teams:*"]
-            for team, b, reason in cross_team_blockers[:4]:
-                icon = "🔴" if b.get("severity") == "high" else "🟡"
-                blocker_lines.append(f"{icon} *[{team}]* {b.get('issue', '')[:100]}")
+            for team, severity, issue in cross_team_blockers[:4]:
+                icon = self.ALERT_ICON.get(severity, "🟡")
+                blocker_lines.append(f"{icon} *[{team}]* {issue[:100]}")
             
             blocks.append({
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": "\n".join(blocker_lines)}
             })
         
-        # Key decisions summary
-        key_decisions = []
-        for team_name, ta in team_analyses.items():
-            for d in ta.decisions[:2]:  # Top 2 per team
-                key_decisions.append((team_name, d.get("decision", "")))
-        
         if key_decisions:
             decision_lines = [f"*✅ Key Decisions ({len(key_decisions)}):*"]
             for team, decision in key_decisions[:5]:
@@ -372,7 +438,7 @@ class DigestFormatter:
                 "text": {"type": "mrkdwn", "text": "\n".join(decision_lines)}
             })
         
-        blocks.append({"type": "divider"})
+        blocks.append(_DIVIDER_BLOCK)
         
         # Cross-team highlights from global digest
         if output.global_digest.cross_team_highlights:
@@ -387,15 +453,9 @@ class DigestFormatter:
             })
         
         # Note about detailed breakdowns
-        blocks.append({
-            "type": "context",
-            "elements": [{
-                "type": "mrkdwn",
-                "text": "📋 _Full details posted to each team's channel_"
-            }]
-        })
+        blocks.append(_DETAILS_CONTEXT_BLOCK)
         
-        text = f"Daily Digest - {date}: {total_messages} messages"
+        text = f"Daily Digest - {date}: {totals.messages} messages"
         return text, blocks
     
     def format_team_details(self, team_analysis: TeamAnalysis) -> str:
@@ -405,72 +465,61 @@ class DigestFormatter:
         This is team-private content, includes everything.
         """
         team_name = team_analysis.team_name
-        emoji = self.EMOJI_MAP.get(team_name, "📁")
-        tone_emoji = self.TONE_EMOJI.get(team_analysis.tone, "")
+        summary = team_analysis.summary
+        themes = team_analysis.themes
+        updates = team_analysis.updates
+        blockers = team_analysis.blockers
+        decisions = team_analysis.decisions
+        action_items = team_analysis.action_items
+        emoji, tone_emoji, title = self._team_meta(team_name, team_analysis.tone)
         
-        lines = [
-            f"{emoji} *{team_name.title()} Daily Digest* {tone_emoji}",
-            "",
-        ]
+        # Each section is a pre-joined block; sections are separated by a blank line
+        sections = [f"{emoji} *{title} Daily Digest* {tone_emoji}"]
         
         # Summary
-        if team_analysis.summary:
-            lines.append(f"_{team_analysis.summary}_")
-            lines.append("")
+        if summary:
+            sections.append(f"_{summary}_")
         
         # Themes
-        if team_analysis.themes:
-            lines.append(f"*Themes:* {', '.join(team_analysis.themes)}")
-            lines.append("")
+        if themes:
+            sections.append(f"*Themes:* {', '.join(themes)}")
+        
+        icons = self.SEVERITY_ICON
         
         # All updates with details
-        if team_analysis.updates:
-            lines.append("*📊 Updates:*")
-            for u in team_analysis.updates:
-                category = u.get("category", "info")
-                author = u.get("author", "")
-                update = u.get("update", "")
-                lines.append(f"• [{category}] {update}")
-                if author:
-                    lines.append(f"  _→ {author}_")
-            lines.append("")
+        if updates:
+            sections.append("*📊 Updates:*\n" + "\n".join(
+                f"• [{u.get('category', 'info')}] {u.get('update', '')}"
+                + (f"\n  _→ {author}_" if (author := u.get("author")) else "")
+                for u in updates
+            ))
         
         # All blockers with full details
-        if team_analysis.blockers:
-            lines.append("*⚠️ Blockers:*")
-            for b in team_analysis.blockers:
-                severity = b.get("severity", "medium")
-                status = b.get("status", "active")
-                owner = b.get("owner", "TBD")
-                icon = "🔴" if severity == "high" else "🟡" if severity == "medium" else "🟢"
-                lines.append(f"{icon} {b.get('issue', '')} [{status}]")
-                lines.append(f"  _Owner: {owner}_")
-            lines.append("")
+        if blockers:
+            sections.append("*⚠️ Blockers:*\n" + "\n".join(
+                f"{icons.get(b.get('severity', 'medium'), '🟢')} {b.get('issue', '')} "
+                f"[{b.get('status', 'active')}]\n  _Owner: {b.get('owner', 'TBD')}_"
+                for b in blockers
+            ))
         
         # All decisions with context
-        if team_analysis.decisions:
-            lines.append("*✅ Decisions:*")
-            for d in team_analysis.decisions:
-                decision = d.get("decision", "")
-                made_by = d.get("made_by", "")
-                context = d.get("context", "")
-                lines.append(f"✓ {decision}")
-                if made_by:
-                    lines.append(f"  _→ {made_by}_")
-                if context:
-                    lines.append(f"  _Context: {context}_")
-            lines.append("")
+        if decisions:
+            sections.append("*✅ Decisions:*\n" + "\n".join(
+                f"✓ {d.get('decision', '')}"
+                + (f"\n  _→ {made_by}_" if (made_by := d.get("made_by")) else "")
+                + (f"\n  _Context: {context}_" if (context := d.get("context")) else "")
+                for d in decisions
+            ))
         
         # Action items
-        if team_analysis.action_items:
-            lines.append("*📌 Action Items:*")
-            for a in team_analysis.action_items:
-                priority = a.get("priority", "medium")
-                icon = "🔴" if priority == "high" else "🟡" if priority == "medium" else "🟢"
-                lines.append(f"{icon} {a.get('description', '')} - _{a.get('owner', 'TBD')}_")
-            lines.append("")
-        
-        return "\n".join(lines)
+        if action_items:
+            sections.append("*📌 Action Items:*\n" + "\n".join(
+                f"{icons.get(a.get('priority', 'medium'), '🟢')} "
+                f"{a.get('description', '')} - _{a.get('owner', 'TBD')}_"
+                for a in action_items
+            ))
+        
+        return "\n\n".join(sections) + "\n"
     
     def format_leadership_dm(
         self, 
@@ -487,80 +536,76 @@ class DigestFormatter:
         - Cross-team dependencies
         """
         date = output.global_digest.date
-        total_messages = sum(ta.message_count for ta in team_analyses.values())
         
-        lines = [
+        # Single pass over teams: status lines, blockers, decisions, actions
+        total_messages = 0
+        status_lines = ["*📊 Team Status:*"]  # seeded with the section heading
+        critical_blockers = []
+        all_decisions = []
+        high_priority_actions = []
+        team_meta = self._team_meta
+        
+        for team_name, ta in team_analyses.items():
+            decisions = ta.decisions
+            tone = ta.tone
+            total_messages += ta.message_count
+            
+            blocker_count = 0
+            for b in ta.blockers:
+                if b.get("status") != "resolved":
+                    blocker_count += 1
+                    critical_blockers.append((team_name, b))
+            
+            all_decisions.extend([(team_name, d) for d in decisions])
+            high_priority_actions.extend([
+                (team_name, a) for a in ta.action_items if a.get("priority") == "high"
+            ])
+            
+            emoji, tone_emoji, title = team_meta(team_name, tone)
+            status_lines.append(
+                f"{emoji} *{title}*: {tone_emoji} {tone} | "
+                f"{blocker_count} blockers | {len(decisions)} decisions"
+            )
+        
+        # Each section is a pre-joined block; sections are separated by a blank line
+        sections = [
             f"*📰 Executive Digest - {date}*",
-            "",
             f"_{total_messages} messages • {len(team_analyses)} teams_",
-            "",
         ]
         
         # Team status summary
-        lines.append("*📊 Team Status:*")
-        for team_name, ta in team_analyses.items():
-            emoji = self.EMOJI_MAP.get(team_name, "📁")
-            tone_emoji = self.TONE_EMOJI.get(ta.tone, "")
-            blocker_count = len([b for b in ta.blockers if b.get("status") != "resolved"])
-            decision_count = len(ta.decisions)
-            lines.append(
-                f"{emoji} *{team_name.title()}*: {tone_emoji} {ta.tone} | "
-                f"{blocker_count} blockers | {decision_count} decisions"
-            )
-        lines.append("")
+        sections.append("\n".join(status_lines))
         
         # ALL critical blockers from all teams
-        critical_blockers = []
-        for team_name, ta in team_analyses.items():
-            for b in ta.blockers:
-                if b.get("status") != "resolved":
-                    critical_blockers.append((team_name, b))
-        
         if critical_blockers:
-            lines.append(f"*🚨 Active Blockers ({len(critical_blockers)}):*")
-            for team, blocker in critical_blockers:
-                severity = blocker.get("severity", "medium")
-                icon = "🔴" if severity == "high" else "🟡"
-                owner = blocker.get("owner", "TBD")
-                lines.append(f"{icon} [{team}] {blocker.get('issue', '')}")
-                lines.append(f"   _Owner: {owner}_")
-            lines.append("")
+            alert_icons = self.ALERT_ICON
+            sections.append(f"*🚨 Active Blockers ({len(critical_blockers)}):*\n" + "\n".join(
+                f"{alert_icons.get(b.get('severity'), '🟡')} [{team}] "
+                f"{b.get('issue', '')}\n   _Owner: {b.get('owner', 'TBD')}_"
+                for team, b in critical_blockers
+            ))
         
         # ALL decisions from all teams
-        all_decisions = []
-        for team_name, ta in team_analyses.items():
-            for d in ta.decisions:
-                all_decisions.append((team_name, d))
-        
         if all_decisions:
-            lines.append(f"*✅ Decisions Made ({len(all_decisions)}):*")
-            for team, decision in all_decisions:
-                made_by = decision.get("made_by", "")
-                lines.append(f"• [{team}] {decision.get('decision', '')}")
-                if made_by:
-                    lines.append(f"   _→ {made_by}_")
-            lines.append("")
+            sections.append(f"*✅ Decisions Made ({len(all_decisions)}):*\n" + "\n".join(
+                f"• [{team}] {d.get('decision', '')}"
+                + (f"\n   _→ {made_by}_" if (made_by := d.get("made_by")) else "")
+                for team, d in all_decisions
+            ))
         
         # Cross-team highlights
         if output.global_digest.cross_team_highlights:
-            lines.append("*🔗 Cross-Team Dependencies:*")
-            for h in output.global_digest.cross_team_highlights:
-                lines.append(f"• {h}")
-            lines.append("")
+            sections.append("*🔗 Cross-Team Dependencies:*\n" + "\n".join(
+                f"• {h}" for h in output.global_digest.cross_team_highlights
+            ))
         
         # High priority action items
-        high_priority_actions = []
-        for team_name, ta in team_analyses.items():
-            for a in ta.action_items:
-                if a.get("priority") == "high":
-                    high_priority_actions.append((team_name, a))
-        
         if high_priority_actions:
-            lines.append(f"*⚡ High Priority Actions ({len(high_priority_actions)}):*")
-            for team, action in high_priority_actions[:5]:
-                lines.append(f"• [{team}] {action.get('description', '')}")
-            lines.append("")
+            sections.append(f"*⚡ High Priority Actions ({len(high_priority_actions)}):*\n" + "\n".join(
+                f"• [{team}] {a.get('description', '')}"
+                for team, a in high_priority_actions[:5]
+            ))
         
-        lines.append("_Full details in team channels._")
+        sections.append("_Full details in team channels._")
         
-        return "\n".join(lines)
+        return "\n\n".join(sections)
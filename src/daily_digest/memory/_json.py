@@ -0,0 +1,39 @@
+"""JSON helpers for memory persistence - orjson when installed, stdlib json otherwise."""
+
+import json
+
+# Optional orjson - falls back to stdlib json (unindented, which keeps the
+# C encoder on the fast path)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+
+    def dumps(obj, default=None) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        option = orjson.OPT_INDENT_2
+        if default is not None:
+            # Send datetimes through default, as stdlib json would
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default, option=option)
+
+    def dumps_line(obj, default=None) -> bytes:
+        """Serialize obj to a single newline-terminated JSON line (for append-only logs)."""
+        option = orjson.OPT_APPEND_NEWLINE
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default, option=option)
+
+    loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+    def dumps(obj, default=None) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return json.dumps(obj, default=default).encode()
+
+    def dumps_line(obj, default=None) -> bytes:
+        """Serialize obj to a single newline-terminated JSON line (for append-only logs)."""
+        return json.dumps(obj, default=default).encode() + b"\n"
+
+    loads = json.loads
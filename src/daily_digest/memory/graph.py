@@ -1,12 +1,19 @@
 """Dependency Graph - tracks cross-team dependencies."""
 
-import json
+import sys
+from collections import Counter
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from ..models.dependencies import Dependency, DependencyType
+from . import _json
+
+
+def _intern(value):
+    """Intern low-cardinality string column values so equal values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 class DependencyGraph:
@@ -18,6 +25,11 @@ class DependencyGraph:
     - Get all dependencies affecting a team
     - Track resolution status
     - Generate cross-team highlights
+    
+    Edges are stored column-wise: one parallel list per field that queries
+    filter on, plus a per-edge dict of the remaining (display) fields. Edge
+    dicts are only materialized for rows returned to callers; the on-disk
+    format is unchanged (a list of edge dicts).
     """
     
     def __init__(self, data_dir: Optional[str] = None):
@@ -31,35 +43,112 @@ class DependencyGraph:
         
         self._load_graph()
     
+    def _reset_columns(self):
+        """Empty all edge columns."""
+        self._edge_ids: list[str] = []
+        self._type: list[str] = []
+        self._from: list[str] = []
+        self._to: list[str] = []
+        self._urgency: list[str] = []
+        self._resolved: list[bool] = []
+        self._meta: list[dict] = []
+        # team -> ascending row indices where the team is from_team / to_team
+        self._from_index: dict[str, list[int]] = {}
+        self._to_index: dict[str, list[int]] = {}
+        # Bumped on every add/resolve; derived lists (indices, highlights, edges)
+        # are cached per generation
+        self._gen = 0
+        self._index_cache: dict[str, tuple[int, list]] = {}
+        # Active edge counts per from_team and type, kept up to date on add/resolve
+        self._team_counts: dict[str, dict[str, int]] = {}
+    
+    def _append_row(self, edge: dict):
+        """Split an edge dict into the column lists and team indexes."""
+        i = len(self._edge_ids)
+        meta = dict(edge)
+        # Team, type and urgency columns repeat a handful of values; interned,
+        # equality checks against them hit the identity fast path
+        from_team = _intern(meta.pop("from_team", None))
+        to_team = _intern(meta.pop("to_team", None))
+        dep_type = _intern(meta.pop("type", None))
+        resolved = bool(meta.pop("resolved", False))
+        
+        self._edge_ids.append(meta.pop("edge_id", None))
+        self._type.append(dep_type)
+        self._from.append(from_team)
+        self._to.append(to_team)
+        self._urgency.append(_intern(meta.pop("urgency", None)))
+        self._resolved.append(resolved)
+        self._meta.append(meta)
+        
+        if not resolved:
+            type_counts = self._team_counts.setdefault(from_team, {})
+            type_counts[dep_type] = type_counts.get(dep_type, 0) + 1
+        
+        self._from_index.setdefault(from_team, []).append(i)
+        self._to_index.setdefault(to_team, []).append(i)
+        self._gen += 1
+    
+    def _row(self, i: int) -> dict:
+        """Materialize edge i as a dict (a copy; mutating it has no effect)."""
+        return {
+            "edge_id": self._edge_ids[i],
+            "type": self._type[i],
+            "from_team": self._from[i],
+            "to_team": self._to[i],
+            "urgency": self._urgency[i],
+            "resolved": self._resolved[i],
+            **self._meta[i],
+        }
+    
+    def _rows(self, indices) -> list[dict]:
+        """Materialize the given edge indices."""
+        row = self._row
+        return [row(i) for i in indices]
+    
+    @property
+    def edges(self) -> list[dict]:
+        """All edges as dicts, in insertion order (cached until the graph changes; do not mutate)."""
+        return self._cached_indices("edges", lambda: self._rows(range(len(self._edge_ids))))
+    
+    def __len__(self) -> int:
+        """Number of edges, resolved or not."""
+        return len(self._edge_ids)
+    
     def _load_graph(self):
         """Load graph from file."""
+        self._reset_columns()
         if self._graph_file.exists():
-            with open(self._graph_file, "r") as f:
-                data = json.load(f)
-                self.edges = data.get("edges", [])
-                self.nodes = set(data.get("nodes", []))
+            data = _json.loads(self._graph_file.read_bytes())
+            for edge in data.get("edges", []):
+                self._append_row(edge)
+            self.nodes = set(data.get("nodes", []))
         else:
-            self.edges = []
             self.nodes = set()
     
     def _save_graph(self):
         """Save graph to file."""
-        with open(self._graph_file, "w") as f:
-            json.dump({
-                "edges": self.edges,
-                "nodes": list(self.nodes),
-            }, f, indent=2)
+        self._graph_file.write_bytes(_json.dumps({
+            "edges": self.edges,
+            "nodes": list(self.nodes),
+        }))
     
     def add_dependency(self, dependency: Dependency) -> str:
         """Add a dependency edge to the graph."""
-        edge_id = f"dep_{len(self.edges)}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        edge_id = self._add_edge(dependency)
+        self._save_graph()
+        return edge_id
+    
+    def _add_edge(self, dependency: Dependency) -> str:
+        """Add a dependency edge without persisting; callers save."""
+        edge_id = f"dep_{len(self._edge_ids)}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
         
         # Add nodes
         self.nodes.add(dependency.from_team)
         self.nodes.add(dependency.to_team)
         
         # Create edge
-        edge = {
+        self._append_row({
             "edge_id": edge_id,
             "type": dependency.dependency_type.value,
             "from_team": dependency.from_team,
@@ -72,10 +161,7 @@ class DependencyGraph:
             "confidence": dependency.confidence,
             "created_at": datetime.now().isoformat(),
             "resolved": False,
-        }
-        
-        self.edges.append(edge)
-        self._save_graph()
+        })
         
         return edge_id
     
@@ -93,43 +179,80 @@ class DependencyGraph:
                       "to" (others depend on team),
                       "both" (all)
         """
-        results = []
-        
-        for edge in self.edges:
-            if edge.get("resolved"):
-                continue
-                
-            if direction == "from" and edge.get("from_team") == team:
-                results.append(edge)
-            elif direction == "to" and edge.get("to_team") == team:
-                results.append(edge)
-            elif direction == "both" and (
-                edge.get("from_team") == team or edge.get("to_team") == team
-            ):
-                results.append(edge)
-        
-        return results
+        # Only the team's own rows are scanned, via the per-team indexes
+        if direction == "from":
+            candidates = self._from_index.get(team, ())
+        elif direction == "to":
+            candidates = self._to_index.get(team, ())
+        elif direction == "both":
+            # Union keeps self-edges (from_team == to_team) once; sort restores
+            # insertion order
+            candidates = sorted(
+                set(self._from_index.get(team, ())).union(self._to_index.get(team, ()))
+            )
+        else:
+            candidates = ()
+        
+        resolved = self._resolved
+        return self._rows([i for i in candidates if not resolved[i]])
+    
+    def _cached_indices(self, key: str, build) -> list:
+        """Return build() memoized until the graph next changes. Do not mutate."""
+        cached = self._index_cache.get(key)
+        if cached is not None and cached[0] == self._gen:
+            return cached[1]
+        indices = build()
+        self._index_cache[key] = (self._gen, indices)
+        return indices
+    
+    def _active_indices(self) -> list[int]:
+        """Indices of unresolved edges."""
+        return self._cached_indices(
+            "active",
+            lambda: [i for i, r in enumerate(self._resolved) if not r],
+        )
+    
+    def _high_urgency_indices(self) -> list[int]:
+        """Indices of unresolved high urgency edges."""
+        resolved = self._resolved
+        return self._cached_indices(
+            "high_urgency",
+            lambda: [i for i, u in enumerate(self._urgency) if u == "high" and not resolved[i]],
+        )
     
     def get_active_dependencies(self) -> list[dict]:
         """Get all unresolved dependencies."""
-        return [e for e in self.edges if not e.get("resolved")]
+        return self._rows(self._active_indices())
     
     def get_high_urgency_dependencies(self) -> list[dict]:
         """Get high urgency unresolved dependencies."""
-        return [
-            e for e in self.edges 
-            if not e.get("resolved") and e.get("urgency") == "high"
-        ]
+        return self._rows(self._high_urgency_indices())
     
     def resolve_dependency(self, edge_id: str) -> bool:
         """Mark a dependency as resolved."""
-        for edge in self.edges:
-            if edge.get("edge_id") == edge_id:
-                edge["resolved"] = True
-                edge["resolved_at"] = datetime.now().isoformat()
-                self._save_graph()
-                return True
-        return False
+        try:
+            i = self._edge_ids.index(edge_id)
+        except ValueError:
+            return False
+        if not self._resolved[i]:
+            self._resolved[i] = True
+            self._discount(i)
+        self._meta[i]["resolved_at"] = datetime.now().isoformat()
+        self._gen += 1
+        self._save_graph()
+        return True
+    
+    def _discount(self, i: int):
+        """Remove edge i from the active per-team counts."""
+        team = self._from[i]
+        type_counts = self._team_counts[team]
+        dep_type = self._type[i]
+        if type_counts[dep_type] > 1:
+            type_counts[dep_type] -= 1
+        else:
+            del type_counts[dep_type]
+            if not type_counts:
+                del self._team_counts[team]
     
     def get_cross_team_highlights(self, max_count: int = 5) -> list[str]:
         """
@@ -137,23 +260,26 @@ class DependencyGraph:
         
         Returns human-readable summaries of important dependencies.
         """
+        # Recomputed only after the graph changes
+        return list(self._cached_indices(
+            f"highlights:{max_count}", lambda: self._build_highlights(max_count)
+        ))
+    
+    def _build_highlights(self, max_count: int) -> list[str]:
+        """Uncached get_cross_team_highlights."""
         highlights = []
         
+        from_team = self._from
+        to_team = self._to
+        
         # High urgency dependencies first
-        high_urgency = self.get_high_urgency_dependencies()
-        for dep in high_urgency[:2]:
+        for i in self._high_urgency_indices()[:2]:
             highlights.append(
-                f"🚨 {dep['from_team']} ↔ {dep['to_team']}: {dep['what_changed']}"
+                f"🚨 {from_team[i]} ↔ {to_team[i]}: {self._meta[i]['what_changed']}"
             )
         
-        # Count by team pairs
-        team_pairs = {}
-        for edge in self.get_active_dependencies():
-            pair = tuple(sorted([edge['from_team'], edge['to_team']]))
-            team_pairs[pair] = team_pairs.get(pair, 0) + 1
-        
-        # Highlight frequent dependencies
-        for pair, count in sorted(team_pairs.items(), key=lambda x: -x[1])[:3]:
+        # Highlight frequent dependencies (ties keep first-seen order)
+        for pair, count in self._top_team_pairs(3):
             if count > 1:
                 highlights.append(
                     f"📊 {pair[0]} & {pair[1]} have {count} active dependencies"
@@ -161,6 +287,17 @@ class DependencyGraph:
         
         return highlights[:max_count]
     
+    def _top_team_pairs(self, n: int) -> list[tuple[tuple[str, str], int]]:
+        """Most frequent active team pairs (unordered) with their edge counts."""
+        active = self._active_indices()
+        from_team = self._from
+        to_team = self._to
+        team_pairs = Counter(
+            (a, b) if a <= b else (b, a)
+            for a, b in ((from_team[i], to_team[i]) for i in active)
+        )
+        return team_pairs.most_common(n)
+    
     def get_team_dependency_count(self) -> dict[str, dict[str, int]]:
         """
         Get dependency counts per team.
@@ -168,23 +305,11 @@ class DependencyGraph:
         Returns dict like:
         {"team_a": {"blocking": 2, "waiting_on": 1}, ...}
         """
-        counts = {}
-        
-        for edge in self.get_active_dependencies():
-            team = edge.get("from_team")
-            dep_type = edge.get("type")
-            
-            if team not in counts:
-                counts[team] = {}
-            
-            counts[team][dep_type] = counts[team].get(dep_type, 0) + 1
-        
-        return counts
+        return {team: dict(type_counts) for team, type_counts in self._team_counts.items()}
     
     def add_dependencies_bulk(self, dependencies: list[Dependency]) -> list[str]:
-        """Add multiple dependencies at once."""
-        edge_ids = []
-        for dep in dependencies:
-            edge_id = self.add_dependency(dep)
-            edge_ids.append(edge_id)
+        """Add multiple dependencies at once, saving the graph once."""
+        edge_ids = [self._add_edge(dep) for dep in dependencies]
+        if edge_ids:
+            self._save_graph()
         return edge_ids
@@ -1,12 +1,32 @@
 """Memory Store - persists decisions, actions, and summaries."""
 
-import json
+import bisect
+import weakref
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from ..models.events import Decision, Blocker, ActionItem, StructuredEvent
+from . import _json
+
+
+def _write_pending(files: dict, pending: dict):
+    """Append queued lines, one write per collection."""
+    for kind, lines in pending.items():
+        if lines:
+            with open(files[kind], "ab") as f:
+                f.write(b"".join(lines))
+            lines.clear()
+
+
+def _flush_on_release(files: dict, pending: dict):
+    """Finalizer: write whatever a store still had queued when collected or at exit."""
+    try:
+        _write_pending(files, pending)
+    except OSError:
+        pass  # data dir gone; nothing sensible to do
 
 
 @dataclass
@@ -44,8 +64,32 @@ class MemoryStore:
     - Open blockers: tracked with age
     - Action items: tasks with ownership
     - Team summaries: daily summaries for reference
+    
+    Each collection is an append-only JSONL log: new records are appended as
+    one line, and mutations are appended as update entries
+    ({"_op": "update", "id": ..., "fields": {...}}) folded in on load. A log
+    is compacted on load once its updates outnumber its records. Legacy
+    single-array .json files are migrated on first load.
+    
+    Single log calls are written immediately. Inside a batch() block appends
+    are buffered and written when the block exits or BUFFER_LIMIT lines are
+    queued; a store that is collected (or still open at interpreter exit)
+    writes anything left in its buffer.
     """
     
+    # Blocker statuses that no longer count as open
+    CLOSED_BLOCKER_STATUSES = frozenset({"resolved", "mitigated"})
+    
+    # Lines queued inside batch() before an early write
+    BUFFER_LIMIT = 64
+    
+    # Record ID field per collection (also the collection's attribute name)
+    ID_KEYS = {
+        "decisions": "decision_id",
+        "blockers": "blocker_id",
+        "actions": "action_id",
+    }
+    
     def __init__(self, data_dir: Optional[str] = None):
         if data_dir:
             self.data_dir = Path(data_dir)
@@ -54,35 +98,140 @@ class MemoryStore:
         
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        self._decisions_file = self.data_dir / "decisions.json"
-        self._blockers_file = self.data_dir / "blockers.json"
-        self._actions_file = self.data_dir / "actions.json"
+        self._files = {kind: self.data_dir / f"{kind}.jsonl" for kind in self.ID_KEYS}
+        
+        # Encoded lines per collection not yet appended to disk; written by flush()
+        self._pending: dict[str, list[bytes]] = {kind: [] for kind in self.ID_KEYS}
+        self._pending_count = 0
+        self._batch_depth = 0
+        # Must not reference self, or the store would never be collected
+        weakref.finalize(self, _flush_on_release, self._files, self._pending)
         
         self._load_state()
     
     def _load_state(self):
         """Load state from files."""
-        self.decisions = self._load_json(self._decisions_file, [])
-        self.blockers = self._load_json(self._blockers_file, [])
-        self.actions = self._load_json(self._actions_file, [])
+        # ID -> record (same dict objects as in the lists) for O(1) mutation,
+        # built while replaying each log
+        self.decisions, _ = self._load_log("decisions")
+        self.blockers, self._blocker_index = self._load_log("blockers")
+        self.actions, self._action_index = self._load_log("actions")
+        self._index_open_blockers()
+        
+        # Epoch seconds per decision (parallel to self.decisions), parsed once.
+        # Logs are written in time order, so this is normally ascending and
+        # recent-decision queries can bisect to the cutoff.
+        ts = self._decision_ts = [self._epoch(d.get("timestamp")) for d in self.decisions]
+        self._decision_ts_sorted = all(a <= b for a, b in zip(ts, ts[1:]))
+    
+    def _index_open_blockers(self):
+        """Rebuild the open-blocker view (ID -> record, in log order)."""
+        closed = self.CLOSED_BLOCKER_STATUSES
+        self._open_blockers = {
+            b.get("blocker_id"): b for b in self.blockers if b.get("status") not in closed
+        }
+    
+    @staticmethod
+    def _epoch(timestamp) -> float:
+        """ISO timestamp -> epoch seconds; -inf if missing or unparseable."""
+        try:
+            return datetime.fromisoformat(timestamp).timestamp()
+        except (ValueError, TypeError):
+            return float("-inf")
+    
+    def _load_log(self, kind: str) -> tuple[list, dict]:
+        """
+        Replay a collection's JSONL log (or migrate its legacy .json array).
+        
+        Returns the records and an ID -> record index over them.
+        """
+        path = self._files[kind]
+        id_key = self.ID_KEYS[kind]
+        if not path.exists():
+            legacy = path.with_suffix(".json")
+            records = self._load_json(legacy, [])
+            if records:
+                self._write_log(kind, records)
+            return records, {r.get(id_key): r for r in records}
+        
+        records = []
+        by_id = {}
+        updates = 0
+        
+        # Stream line by line rather than holding the whole file in memory
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    entry = _json.loads(line)
+                except ValueError:
+                    continue  # blank line or a write torn by a crash
+                
+                if entry.get("_op") == "update":
+                    updates += 1
+                    target = by_id.get(entry.get("id"))
+                    if target is not None:
+                        target.update(entry.get("fields", {}))
+                else:
+                    records.append(entry)
+                    by_id[entry.get(id_key)] = entry
+        
+        if updates > len(records):
+            self._write_log(kind, records)
+        
+        return records, by_id
     
     def _load_json(self, path: Path, default) -> list:
         """Load JSON file or return default."""
         if path.exists():
-            with open(path, "r") as f:
-                return json.load(f)
+            return _json.loads(path.read_bytes())
         return default
     
-    def _save_json(self, path: Path, data: list):
-        """Save data to JSON file."""
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+    def _write_log(self, kind: str, records: list):
+        """Rewrite a collection's log as one line per record."""
+        self._files[kind].write_bytes(
+            b"".join(_json.dumps_line(r, default=str) for r in records)
+        )
+    
+    def _append(self, kind: str, entry: dict):
+        """Queue one log line; written at once unless batching and the buffer has room."""
+        self._pending[kind].append(_json.dumps_line(entry, default=str))
+        self._pending_count += 1
+        if not self._batch_depth or self._pending_count >= self.BUFFER_LIMIT:
+            self.flush()
+    
+    def _append_update(self, kind: str, record_id: str, fields: dict):
+        """Queue an update entry for an existing record."""
+        self._append(kind, {"_op": "update", "id": record_id, "fields": fields})
+    
+    def flush(self):
+        """Append all queued lines, one write per collection."""
+        _write_pending(self._files, self._pending)
+        self._pending_count = 0
+    
+    def compact(self):
+        """Rewrite every log as its current records, dropping update entries."""
+        self.flush()
+        for kind in self.ID_KEYS:
+            self._write_log(kind, getattr(self, kind))
+    
+    @contextmanager
+    def batch(self):
+        """Defer appends until the block exits, then write each changed log once."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
     
     # Decision logging
     
-    def log_decision(self, decision: Decision) -> str:
+    def log_decision(self, decision: Decision, now: Optional[datetime] = None) -> str:
         """Log a decision and return its ID."""
-        decision_id = f"dec_{len(self.decisions)}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        if now is None:
+            now = datetime.now()
+        decision_id = f"dec_{len(self.decisions)}_{now.strftime('%Y%m%d%H%M%S')}"
         
         stored = {
             "decision_id": decision_id,
@@ -92,12 +241,16 @@ class MemoryStore:
             "team": decision.teams_involved[0] if decision.teams_involved else "",
             "context": decision.context,
             "impact": decision.impact,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "source_channel": decision.source_channel,
         }
         
         self.decisions.append(stored)
-        self._save_json(self._decisions_file, self.decisions)
+        ts = now.timestamp()
+        if self._decision_ts and ts < self._decision_ts[-1]:
+            self._decision_ts_sorted = False  # clock went backwards
+        self._decision_ts.append(ts)
+        self._append("decisions", stored)
         
         return decision_id
     
@@ -105,23 +258,20 @@ class MemoryStore:
         """Get decisions from the last N days."""
         cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
         
-        results = []
-        for dec in self.decisions:
-            try:
-                ts = datetime.fromisoformat(dec.get("timestamp", "")).timestamp()
-                if ts >= cutoff:
-                    if team is None or dec.get("team") == team:
-                        results.append(dec)
-            except (ValueError, TypeError):
-                continue
-        
-        return results
+        # Only the tail at or after the cutoff when timestamps are ascending
+        start = bisect.bisect_left(self._decision_ts, cutoff) if self._decision_ts_sorted else 0
+        return [
+            dec for dec, ts in zip(self.decisions[start:], self._decision_ts[start:])
+            if ts >= cutoff and (team is None or dec.get("team") == team)
+        ]
     
     # Blocker tracking
     
-    def log_blocker(self, blocker: Blocker) -> str:
+    def log_blocker(self, blocker: Blocker, now: Optional[datetime] = None) -> str:
         """Log a blocker and return its ID."""
-        blocker_id = f"blk_{len(self.blockers)}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        if now is None:
+            now = datetime.now()
+        blocker_id = f"blk_{len(self.blockers)}_{now.strftime('%Y%m%d%H%M%S')}"
         
         stored = {
             "blocker_id": blocker_id,
@@ -131,12 +281,15 @@ class MemoryStore:
             "severity": blocker.severity,
             "status": blocker.status,
             "blocked_by": blocker.blocked_by,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "resolved_at": None,
         }
         
         self.blockers.append(stored)
-        self._save_json(self._blockers_file, self.blockers)
+        self._blocker_index[blocker_id] = stored
+        if stored["status"] not in self.CLOSED_BLOCKER_STATUSES:
+            self._open_blockers[blocker_id] = stored
+        self._append("blockers", stored)
         
         return blocker_id
     
@@ -145,36 +298,43 @@ class MemoryStore:
         results = []
         now = datetime.now()
         
-        for blk in self.blockers:
-            if blk.get("status") not in ["resolved", "mitigated"]:
-                if team is None or blk.get("team") == team:
-                    # Calculate age
-                    try:
-                        created = datetime.fromisoformat(blk.get("created_at", ""))
-                        age_days = (now - created).days
-                        blk["age_days"] = age_days
-                    except (ValueError, TypeError):
-                        blk["age_days"] = 0
-                    
-                    results.append(blk)
+        # Only open blockers are visited; resolved history is skipped entirely
+        for blk in self._open_blockers.values():
+            if team is None or blk.get("team") == team:
+                # Calculate age
+                try:
+                    created = datetime.fromisoformat(blk.get("created_at", ""))
+                    age_days = (now - created).days
+                    blk["age_days"] = age_days
+                except (ValueError, TypeError):
+                    blk["age_days"] = 0
+                
+                results.append(blk)
         
         return results
     
     def resolve_blocker(self, blocker_id: str, status: str = "resolved") -> bool:
         """Mark a blocker as resolved."""
-        for blk in self.blockers:
-            if blk.get("blocker_id") == blocker_id:
-                blk["status"] = status
-                blk["resolved_at"] = datetime.now().isoformat()
-                self._save_json(self._blockers_file, self.blockers)
-                return True
-        return False
+        blk = self._blocker_index.get(blocker_id)
+        if blk is None:
+            return False
+        fields = {"status": status, "resolved_at": datetime.now().isoformat()}
+        blk.update(fields)
+        self._append_update("blockers", blocker_id, fields)
+        
+        if status in self.CLOSED_BLOCKER_STATUSES:
+            self._open_blockers.pop(blocker_id, None)
+        elif blocker_id not in self._open_blockers:
+            self._index_open_blockers()  # re-opened: rebuild to keep log order
+        return True
     
     # Action items
     
-    def log_action(self, action: ActionItem) -> str:
+    def log_action(self, action: ActionItem, now: Optional[datetime] = None) -> str:
         """Log an action item and return its ID."""
-        action_id = f"act_{len(self.actions)}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        if now is None:
+            now = datetime.now()
+        action_id = f"act_{len(self.actions)}_{now.strftime('%Y%m%d%H%M%S')}"
         
         stored = {
             "action_id": action_id,
@@ -183,12 +343,13 @@ class MemoryStore:
             "priority": action.priority,
             "due_date": action.due_date,
             "source_link": action.source_link,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "completed": False,
         }
         
         self.actions.append(stored)
-        self._save_json(self._actions_file, self.actions)
+        self._action_index[action_id] = stored
+        self._append("actions", stored)
         
         return action_id
     
@@ -205,13 +366,13 @@ class MemoryStore:
     
     def complete_action(self, action_id: str) -> bool:
         """Mark an action as complete."""
-        for act in self.actions:
-            if act.get("action_id") == action_id:
-                act["completed"] = True
-                act["completed_at"] = datetime.now().isoformat()
-                self._save_json(self._actions_file, self.actions)
-                return True
-        return False
+        act = self._action_index.get(action_id)
+        if act is None:
+            return False
+        fields = {"completed": True, "completed_at": datetime.now().isoformat()}
+        act.update(fields)
+        self._append_update("actions", action_id, fields)
+        return True
     
     # Bulk operations
     
@@ -223,12 +384,15 @@ class MemoryStore:
             "actions_logged": 0,
         }
         
-        for event in events:
-            if isinstance(event, Decision):
-                self.log_decision(event)
-                results["decisions_logged"] += 1
-            elif isinstance(event, Blocker):
-                self.log_blocker(event)
-                results["blockers_logged"] += 1
+        # One append per changed log, not one per event; one clock read per batch
+        now = datetime.now()
+        with self.batch():
+            for event in events:
+                if isinstance(event, Decision):
+                    self.log_decision(event, now)
+                    results["decisions_logged"] += 1
+                elif isinstance(event, Blocker):
+                    self.log_blocker(event, now)
+                    results["blockers_logged"] += 1
         
         return results
@@ -1,9 +1,12 @@
 """Message aggregator for fetching and filtering Slack messages."""
 
+import asyncio
+import os
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from .slack_client import SlackClient
 from .config import DigestConfig
@@ -37,16 +40,39 @@ class MessageAggregator:
     """
     
     # Patterns for noise filtering
-    BOT_SUBTYPE_PATTERNS = {"bot_message", "bot_add", "bot_remove"}
-    SYSTEM_SUBTYPES = {
+    BOT_SUBTYPE_PATTERNS = frozenset({"bot_message", "bot_add", "bot_remove"})
+    SYSTEM_SUBTYPES = frozenset({
         "channel_join", "channel_leave", "channel_topic", 
         "channel_purpose", "channel_name", "group_join",
         "group_leave", "group_topic", "group_purpose"
-    }
+    })
+    # Everything skipped by subtype when bot filtering is on
+    _ALL_SKIP_SUBTYPES = BOT_SUBTYPE_PATTERNS | SYSTEM_SUBTYPES
+    
+    # Text made only of :shortcode: emoji, emoticon/symbol/transport/flag
+    # emoji and whitespace. One fullmatch, no intermediate strings.
+    _REACTION_ONLY_RE = re.compile(
+        r"(?:\s|:[a-zA-Z0-9_+-]+:"
+        r"|[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF])*"
+    )
+    _MENTION_RE = re.compile(r"<@(U[A-Z0-9_]+)>")
+    
+    # Channel histories fetched concurrently (keeps bursts under Slack rate limits)
+    MAX_CONCURRENT_FETCHES = 8
     
     def __init__(self, slack_client: SlackClient, config: DigestConfig):
         self.client = slack_client
         self.config = config
+        # Read once; FILTER_BOTS changes after construction are not picked up
+        self._filter_bots = os.getenv("FILTER_BOTS", "true").lower() == "true"
+        self._skip_subtypes = (
+            self._ALL_SKIP_SUBTYPES if self._filter_bots else self.SYSTEM_SUBTYPES
+        )
+        # user_id -> display name for this aggregator's lifetime (one digest run);
+        # also remembers IDs the client could not resolve
+        self._name_cache: dict[str, str] = {}
+        # epoch minute -> "YYYY-MM-DDTHH:MM" (messages cluster within minutes)
+        self._minute_cache: dict[int, str] = {}
     
     async def fetch_all_channels(
         self, 
@@ -66,17 +92,17 @@ class MessageAggregator:
             since = datetime.now() - timedelta(hours=self.config.lookback_hours)
         
         since_ts = str(since.timestamp())
-        results = []
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
         
-        for team_name, channel_id in self.config.channels.items():
-            channel_messages = await self._fetch_channel(
-                team_name, 
-                channel_id, 
-                since_ts
-            )
-            results.append(channel_messages)
+        async def fetch(team_name: str, channel_id: str) -> ChannelMessages:
+            async with semaphore:
+                return await self._fetch_channel(team_name, channel_id, since_ts)
         
-        return results
+        # gather keeps results in config order
+        return list(await asyncio.gather(*(
+            fetch(team_name, channel_id)
+            for team_name, channel_id in self.config.channels.items()
+        )))
     
     async def _fetch_channel(
         self, 
@@ -87,11 +113,8 @@ class MessageAggregator:
         """Fetch and process messages from a single channel."""
         raw_messages = await self.client.get_channel_history(channel_id, since_ts)
         
-        # Filter noise
-        filtered = self.filter_noise(raw_messages)
-        
-        # Enrich messages with user names
-        enriched = self._enrich_messages(filtered)
+        # Filter noise and enrich with user names in a single pass
+        enriched = self._enrich_messages(self._iter_signal(raw_messages))
         
         # Get channel name if available
         channel_name = team_name
@@ -115,21 +138,20 @@ class MessageAggregator:
         - Messages with only reactions/attachments (no text)
         - Empty messages
         """
-        import os
-        filter_bots = os.getenv("FILTER_BOTS", "true").lower() == "true"
-        
-        filtered = []
+        return list(self._iter_signal(messages))
+    
+    def _iter_signal(self, messages: Iterable[dict]) -> Iterator[dict]:
+        """Yield the messages filter_noise keeps, lazily (see filter_noise)."""
+        filter_bots = self._filter_bots
+        skip_subtypes = self._skip_subtypes
         
         for msg in messages:
-            # Skip bot messages (controlled by FILTER_BOTS env var)
-            if filter_bots:
-                if msg.get("subtype") in self.BOT_SUBTYPE_PATTERNS:
-                    continue
-                if msg.get("bot_id"):
-                    continue
+            # Skip system messages, and bot subtypes when FILTER_BOTS is enabled
+            if msg.get("subtype") in skip_subtypes:
+                continue
             
-            # Skip system messages
-            if msg.get("subtype") in self.SYSTEM_SUBTYPES:
+            # Skip other bot-posted messages (controlled by FILTER_BOTS env var)
+            if filter_bots and msg.get("bot_id"):
                 continue
             
             # Skip empty or reactions-only messages
@@ -141,52 +163,68 @@ class MessageAggregator:
             if self._is_reaction_only(text):
                 continue
             
-            filtered.append(msg)
-        
-        return filtered
+            yield msg
     
     def _is_reaction_only(self, text: str) -> bool:
         """Check if message is just emoji reactions."""
-        # Remove all emoji patterns
-        cleaned = re.sub(r":[a-zA-Z0-9_+-]+:", "", text)
-        cleaned = re.sub(r"[\U0001F600-\U0001F64F]", "", cleaned)  # emoticons
-        cleaned = re.sub(r"[\U0001F300-\U0001F5FF]", "", cleaned)  # symbols
-        cleaned = re.sub(r"[\U0001F680-\U0001F6FF]", "", cleaned)  # transport
-        cleaned = re.sub(r"[\U0001F1E0-\U0001F1FF]", "", cleaned)  # flags
-        return not cleaned.strip()
-    
-    def _enrich_messages(self, messages: list[dict]) -> list[dict]:
-        """Add author names and clean up user mentions."""
+        return self._REACTION_ONLY_RE.fullmatch(text) is not None
+    
+    def _enrich_messages(self, messages: Iterable[dict]) -> list[dict]:
+        """
+        Add author names and clean up user mentions.
+        
+        Returns slim dicts (user, ts, author, text, timestamp); the original
+        Slack payload is kept by reference under "raw" rather than copied.
+        timestamp is local time at minute precision - the full value is in ts.
+        """
         enriched = []
         
         for msg in messages:
-            enriched_msg = msg.copy()
-            
-            # Add author name
             user_id = msg.get("user", "Unknown")
-            enriched_msg["author"] = self.client.get_user_name(user_id)
-            
-            # Replace user mentions with names
-            text = msg.get("text", "")
-            enriched_msg["text"] = self._resolve_mentions(text)
-            
-            # Parse timestamp
             ts = msg.get("ts", "0")
-            enriched_msg["timestamp"] = datetime.fromtimestamp(
-                float(ts)
-            ).isoformat()
             
-            enriched.append(enriched_msg)
+            enriched.append({
+                "user": user_id,
+                "ts": ts,
+                # Add author name
+                "author": self._user_name(user_id),
+                # Replace user mentions with names
+                "text": self._resolve_mentions(msg.get("text", "")),
+                # Parse timestamp
+                "timestamp": self._minute_timestamp(ts),
+                "raw": msg,
+            })
         
         return enriched
     
+    def _minute_timestamp(self, ts: str) -> str:
+        """Local ISO timestamp trimmed to the minute for a Slack ts."""
+        minute = int(float(ts)) // 60
+        stamp = self._minute_cache.get(minute)
+        if stamp is None:
+            stamp = self._minute_cache[minute] = time.strftime(
+                "%Y-%m-%dT%H:%M", time.localtime(minute * 60)
+            )
+        return stamp
+    
+    def _user_name(self, user_id: str) -> str:
+        """Display name for a user ID, looked up once per aggregator."""
+        name = self._name_cache.get(user_id)
+        if name is None:
+            name = self._name_cache[user_id] = self.client.get_user_name(user_id)
+        return name
+    
     def _resolve_mentions(self, text: str) -> str:
         """Replace <@Uxxxx> mentions with user names."""
+        # Most messages mention nobody; skip the regex pass entirely
+        if "<@" not in text:
+            return text
+        
         def replace_mention(match):
             user_id = match.group(1)
-            return f"@{self.client.get_user_name(user_id)}"
+            return f"@{self._user_name(user_id)}"
         
-        return re.sub(r"<@(U[A-Z0-9_]+)>", replace_mention, text)
+        return self._MENTION_RE.sub(replace_mention, text)
     
     def format_messages_for_llm(self, messages: list[dict]) -> str:
         """
@@ -195,11 +233,8 @@ class MessageAggregator:
         Returns a string with one message per line in format:
         [timestamp] Author: Message text
         """
-        lines = []
-        for msg in messages:
-            author = msg.get("author", "Unknown")
-            text = msg.get("text", "")
-            ts = msg.get("timestamp", "")[:16]  # Trim to minute precision
-            lines.append(f"[{ts}] {author}: {text}")
-        
-        return "\n".join(lines)
+        # Timestamps trimmed to minute precision
+        return "\n".join([
+            f"[{msg.get('timestamp', '')[:16]}] {msg.get('author', 'Unknown')}: {msg.get('text', '')}"
+            for msg in messages
+        ])
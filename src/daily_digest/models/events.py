@@ -93,7 +93,7 @@ class Question(StructuredEvent):
         self.event_type = EventType.QUESTION
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionItem:
     """A concrete task extracted from messages."""
     
@@ -2,7 +2,7 @@
 
 import logging
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from uuid import uuid4
@@ -39,7 +39,19 @@ class PipelineMetrics:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/storage."""
-        return asdict(self)
+        # Every field is flat, so shallow container copies match asdict()
+        # without its recursive deepcopy
+        return {
+            "run_id": self.run_id,
+            "run_timestamp": self.run_timestamp,
+            "channels_processed": self.channels_processed,
+            "messages_per_channel": dict(self.messages_per_channel),
+            "token_usage": dict(self.token_usage),
+            "total_tokens": self.total_tokens,
+            "agent_durations_ms": dict(self.agent_durations_ms),
+            "total_duration_ms": self.total_duration_ms,
+            "failures": list(self.failures),
+        }
 
 
 class MetricsLogger:
@@ -60,20 +72,20 @@ class MetricsLogger:
     
     def __init__(self):
         self.metrics = PipelineMetrics()
-        self._start_time: Optional[float] = None
+        self._start_time: Optional[int] = None  # time.monotonic_ns()
         self._agent_start: Optional[float] = None
     
     def start(self):
         """Start pipeline timing."""
-        self._start_time = time.time()
+        self._start_time = time.monotonic_ns()
         logger.info(f"Pipeline run started: {self.metrics.run_id}")
     
     def finish(self):
         """Finish pipeline timing."""
-        if self._start_time:
-            self.metrics.total_duration_ms = int(
-                (time.time() - self._start_time) * 1000
-            )
+        if self._start_time is not None:
+            self.metrics.total_duration_ms = (
+                time.monotonic_ns() - self._start_time
+            ) // 1_000_000
     
     def record_channel(
         self, 
@@ -102,37 +114,40 @@ class MetricsLogger:
         return AgentTimer(self, agent_name)
     
     def log_summary(self):
-        """Log a summary of the pipeline run."""
+        """Log a summary of the pipeline run as a single record."""
         m = self.metrics
         
-        logger.info("=" * 50)
-        logger.info(f"Pipeline Run Summary: {m.run_id}")
-        logger.info("=" * 50)
-        logger.info(f"Timestamp: {m.run_timestamp}")
-        logger.info(f"Duration: {m.total_duration_ms}ms")
-        logger.info(f"Channels processed: {m.channels_processed}")
+        lines = [
+            "=" * 50,
+            f"Pipeline Run Summary: {m.run_id}",
+            "=" * 50,
+            f"Timestamp: {m.run_timestamp}",
+            f"Duration: {m.total_duration_ms}ms",
+            f"Channels processed: {m.channels_processed}",
+        ]
         
         if m.messages_per_channel:
-            logger.info("Messages per channel:")
-            for channel, count in m.messages_per_channel.items():
-                logger.info(f"  - {channel}: {count}")
+            lines.append("Messages per channel:")
+            lines.extend(f"  - {channel}: {count}" for channel, count in m.messages_per_channel.items())
         
         if m.token_usage:
-            logger.info(f"Total tokens used: {m.total_tokens}")
+            lines.append(f"Total tokens used: {m.total_tokens}")
         
         if m.agent_durations_ms:
-            logger.info("Agent durations:")
-            for agent, ms in m.agent_durations_ms.items():
-                logger.info(f"  - {agent}: {ms}ms")
+            lines.append("Agent durations:")
+            lines.extend(f"  - {agent}: {ms}ms" for agent, ms in m.agent_durations_ms.items())
         
         if m.failures:
-            logger.warning(f"Failures: {len(m.failures)}")
-            for failure in m.failures:
-                logger.warning(f"  - {failure}")
+            lines.append(f"Failures: {len(m.failures)}")
+            lines.extend(f"  - {failure}" for failure in m.failures)
         else:
-            logger.info("Status: SUCCESS")
+            lines.append("Status: SUCCESS")
+        
+        lines.append("=" * 50)
         
-        logger.info("=" * 50)
+        # One record (one handler write); failed runs are logged as a warning
+        level = logging.WARNING if m.failures else logging.INFO
+        logger.log(level, "\n".join(lines))
 
 
 class AgentTimer:
@@ -141,16 +156,16 @@ class AgentTimer:
     def __init__(self, metrics_logger: MetricsLogger, agent_name: str):
         self.metrics_logger = metrics_logger
         self.agent_name = agent_name
-        self.start_time: Optional[float] = None
+        self.start_time: Optional[int] = None  # time.monotonic_ns()
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
         logger.debug(f"Starting agent: {self.agent_name}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration_ms = int((time.time() - self.start_time) * 1000)
+        if self.start_time is not None:
+            duration_ms = (time.monotonic_ns() - self.start_time) // 1_000_000
             self.metrics_logger.record_agent_duration(self.agent_name, duration_ms)
             logger.debug(f"Agent {self.agent_name} completed in {duration_ms}ms")
         
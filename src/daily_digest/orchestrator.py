@@ -1,7 +1,10 @@
 """Orchestrator - main pipeline for digest generation."""
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from typing import Optional
 
 from .config import DigestConfig, get_config
@@ -16,9 +19,28 @@ from .models.events import StructuredEvent, Decision, Blocker, ActionItem
 from .models.dependencies import Dependency, CrossTeamAlert
 # Storage
 from .memory import MemoryStore, DependencyGraph
+from .memory import _json
 
 # Observability
 from .observability import MetricsLogger, logger
+from .rate_limit import AsyncTokenBucket
+
+
+_summary = attrgetter("summary")
+_description = attrgetter("description")
+
+
+def _dedup_take(items, n: int) -> list:
+    """First n distinct items in order, stopping once n are found."""
+    seen = set()
+    out = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+            if len(out) == n:
+                break
+    return out
 
 
 @dataclass
@@ -42,23 +64,24 @@ class DigestOutput:
     
     def to_json(self) -> dict:
         """Convert to JSON-serializable dict."""
+        gd = self.global_digest
         return {
             "global_digest": {
-                "date": self.global_digest.date,
-                "cross_team_highlights": self.global_digest.cross_team_highlights,
-                "org_wide_risks": [e.summary for e in self.global_digest.org_wide_risks],
-                "notable_decisions": [d.summary for d in self.global_digest.notable_decisions],
-                "total_events": self.global_digest.total_events,
+                "date": gd.date,
+                "cross_team_highlights": gd.cross_team_highlights,
+                "org_wide_risks": list(map(_summary, gd.org_wide_risks)),
+                "notable_decisions": list(map(_summary, gd.notable_decisions)),
+                "total_events": gd.total_events,
             },
             "personalized_digests": [
                 {
                     "user_id": pd.user_id,
                     "delivery": {"type": pd.delivery_type, "target": pd.delivery_target},
                     "sections": {
-                        "top_updates": [e.summary for e in pd.top_updates],
-                        "blockers": [e.summary for e in pd.blockers],
-                        "decisions": [e.summary for e in pd.decisions],
-                        "action_items": [a.description for a in pd.action_items],
+                        "top_updates": list(map(_summary, pd.top_updates)),
+                        "blockers": list(map(_summary, pd.blockers)),
+                        "decisions": list(map(_summary, pd.decisions)),
+                        "action_items": list(map(_description, pd.action_items)),
                     }
                 }
                 for pd in self.personalized_digests
@@ -75,8 +98,14 @@ class DigestOutput:
                     "action_items": ta.action_items,
                 }
                 for name, ta in self.team_analyses.items()
+                # Quiet channels carry only the placeholder summary
+                if ta.message_count > 0 or ta.updates
             },
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """to_json() encoded as UTF-8 JSON (orjson when installed)."""
+        return _json.dumps(self.to_json())
 
 
 class DigestOrchestrator:
@@ -105,6 +134,13 @@ class DigestOrchestrator:
         self.team_analyzer = TeamAnalyzerAgent(mock_mode=mock_mode)
         self.dependency_linker = DependencyLinker(mock_mode=mock_mode)
         
+        # Shared by every agent call: caps requests in flight and paces them
+        # to the provider's per-minute budget (initial burst up to the cap)
+        self._llm_sem = asyncio.Semaphore(self.config.max_concurrent_llm)
+        self._llm_bucket = AsyncTokenBucket(
+            self.config.rate_limit_rpm, capacity=self.config.max_concurrent_llm
+        )
+        
         # Storage
         self.memory = MemoryStore()
         self.dep_graph = DependencyGraph()
@@ -125,6 +161,8 @@ class DigestOrchestrator:
             Complete DigestOutput with global and personalized content
         """
         self.metrics.start()
+        # Dated by when the run started, even if it finishes after midnight
+        digest_date = datetime.now().strftime("%Y-%m-%d")
         
         try:
             # Step 0a: Auto-process prior feedback (B1)
@@ -143,32 +181,45 @@ class DigestOrchestrator:
             logger.info("Step 1: Analyzing teams...")
             team_analyses, events_by_team = await self._step1_analyze_teams(channel_messages, aggregator)
             
-            all_events = []
-            for events in events_by_team.values():
-                all_events.extend(events)
+            all_events = list(chain.from_iterable(events_by_team.values()))
             logger.info(f"Extracted {len(all_events)} events from {len(team_analyses)} teams")
             
-            # Step 2: Detect dependencies
+            # Step 2: Detect dependencies (in the background; step 3 doesn't need them)
             logger.info("Step 2: Detecting cross-team dependencies...")
-            dependencies, highlights = await self._step2_detect_dependencies(events_by_team)
+            dep_task = asyncio.create_task(self._step2_detect_dependencies(events_by_team))
+            
+            async def summarize_and_extract():
+                # One pass over the events for digest risks/decisions and step 3 actions
+                risks, decisions, event_actions = self._summarize_events(all_events)
+                
+                # Step 3: Extract action items
+                logger.info("Step 3: Extracting action items...")
+                return risks, decisions, self._step3_extract_actions(event_actions, team_analyses)
+            
+            try:
+                # Tasks start in creation order, so step 2 hands its LLM call to a
+                # worker thread before step 3's CPU work runs
+                risks, decisions, actions = await asyncio.create_task(summarize_and_extract())
+                logger.info(f"Extracted {len(actions)} action items")
+                
+                dependencies, highlights = await dep_task
+            finally:
+                # Don't leave the linker call running (or its error unretrieved)
+                if not dep_task.done():
+                    dep_task.cancel()
             logger.info(f"Found {len(dependencies)} dependencies")
             
             # Step 2b: Create CrossTeamAlerts from dependencies (C1)
             cross_team_alerts = self.dependency_linker.create_alerts(dependencies)
             logger.info(f"Created {len(cross_team_alerts)} cross-team alerts")
             
-            # Step 3: Extract action items
-            logger.info("Step 3: Extracting action items...")
-            actions = self._step3_extract_actions(all_events, team_analyses)
-            logger.info(f"Extracted {len(actions)} action items")
-            
             # Step 4: Write to memory
             logger.info("Step 4: Writing to memory...")
             memory_writes = self._step4_memory_writes(all_events, dependencies)
             
             # Create global digest with alerts
             global_digest = self._create_global_digest(
-                all_events, dependencies, highlights, cross_team_alerts
+                digest_date, risks, decisions, len(all_events), highlights, cross_team_alerts
             )
             
             self.metrics.finish()
@@ -236,6 +287,14 @@ class DigestOrchestrator:
             logger.debug(f"Feedback processing skipped: {e}")
             return {}
     
+    async def _call_llm(self, func, *args):
+        """Run a blocking agent call in a thread, within the shared LLM limits."""
+        async with self._llm_sem:
+            # Mock agents make no provider calls, so there is no budget to respect
+            if not self.mock_mode:
+                await self._llm_bucket.acquire()
+            return await asyncio.to_thread(func, *args)
+    
     async def _step1_analyze_teams(
         self,
         channel_messages: list[ChannelMessages],
@@ -245,6 +304,34 @@ class DigestOrchestrator:
         team_analyses = {}
         events_by_team = {}
         
+        # Load feedback directives for every active team before the analyzer calls start
+        self.team_analyzer.prefetch_feedback_instructions(
+            [cm.team_name for cm in channel_messages if cm.message_count > 0]
+        )
+        
+        def analyze(cm: ChannelMessages) -> TeamAnalysis:
+            # Runs in a worker thread; each team records its own duration key
+            with self.metrics.track_agent(f"team_analyzer_{cm.team_name}"):
+                return self.team_analyzer.analyze_team(
+                    aggregator.format_messages_for_llm(cm.messages),
+                    cm.team_name,
+                    cm.channel_id,
+                    cm.message_count,
+                )
+        
+        # Analyzer calls are blocking LLM round-trips: run them in threads so
+        # active teams' requests overlap, within the LLM limits
+        active = [cm for cm in channel_messages if cm.message_count > 0]
+        results = await asyncio.gather(
+            *(self._call_llm(analyze, cm) for cm in active),
+            return_exceptions=True,
+        )
+        # Wait for every call to settle, then fail like the serial loop did
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        analyses = {cm.team_name: analysis for cm, analysis in zip(active, results)}
+        
         for cm in channel_messages:
             if cm.message_count == 0:
                 # Create empty analysis for teams with no messages
@@ -258,18 +345,7 @@ class DigestOrchestrator:
                 events_by_team[cm.team_name] = []
                 continue
             
-            # Format messages for LLM
-            messages_text = aggregator.format_messages_for_llm(cm.messages)
-            
-            # Analyze team with unified agent
-            with self.metrics.track_agent(f"team_analyzer_{cm.team_name}"):
-                analysis = self.team_analyzer.analyze_team(
-                    messages_text,
-                    cm.team_name,
-                    cm.channel_id,
-                    cm.message_count,
-                )
-            
+            analysis = analyses[cm.team_name]
             team_analyses[cm.team_name] = analysis
             events_by_team[cm.team_name] = analysis.to_events()
             self.metrics.record_channel(cm.team_name, len(events_by_team[cm.team_name]))
@@ -284,45 +360,70 @@ class DigestOrchestrator:
         if len(events_by_team) < 2:
             return [], []
         
-        with self.metrics.track_agent("dependency_linker"):
-            dependencies, highlights = self.dependency_linker.detect_dependencies(
-                events_by_team
-            )
+        def detect() -> tuple[list[Dependency], list[str]]:
+            with self.metrics.track_agent("dependency_linker"):
+                return self.dependency_linker.detect_dependencies(events_by_team)
+        
+        dependencies, highlights = await self._call_llm(detect)
         
         # Store in graph
         self.dep_graph.add_dependencies_bulk(dependencies)
         
         return dependencies, highlights
     
-    def _step3_extract_actions(
+    def _summarize_events(
         self,
         events: list[StructuredEvent],
-        team_analyses: dict[str, TeamAnalysis],
-    ) -> list[ActionItem]:
-        """Step 3: Generate action items from events and team analyses."""
+    ) -> tuple[list[Blocker], list[Decision], list[ActionItem]]:
+        """
+        Partition events in a single pass.
+        
+        Returns:
+            (org-wide risks, decisions, action items derived from events)
+        """
+        risks = []
+        decisions = []
         actions = []
+        # Action items from one run share a creation time
+        created_at = datetime.now().isoformat()
         
-        # Extract from events
         for event in events:
-            # Blockers become action items
-            if isinstance(event, Blocker) and event.status != "resolved":
-                actions.append(ActionItem(
-                    description=f"Resolve: {event.issue}",
-                    owner=event.owner or "unassigned",
-                    source_event_type=event.event_type,
-                    source_link=event.source_permalink or "",
-                    priority="high" if event.severity == "high" else "medium",
-                ))
-            
-            # Decisions may have follow-ups
-            if isinstance(event, Decision) and event.impact:
-                actions.append(ActionItem(
-                    description=f"Follow up: {event.what_decided}",
-                    owner=event.decided_by or "unassigned",
-                    source_event_type=event.event_type,
-                    source_link=event.source_permalink or "",
-                    priority="medium",
-                ))
+            if isinstance(event, Blocker):
+                # High urgency blockers are org-wide risks
+                if event.urgency == "high":
+                    risks.append(event)
+                # Blockers become action items
+                if event.status != "resolved":
+                    actions.append(ActionItem(
+                        description=f"Resolve: {event.issue}",
+                        owner=event.owner or "unassigned",
+                        source_event_type=event.event_type,
+                        source_link=event.source_permalink or "",
+                        priority="high" if event.severity == "high" else "medium",
+                        created_at=created_at,
+                    ))
+            elif isinstance(event, Decision):
+                decisions.append(event)
+                # Decisions may have follow-ups
+                if event.impact:
+                    actions.append(ActionItem(
+                        description=f"Follow up: {event.what_decided}",
+                        owner=event.decided_by or "unassigned",
+                        source_event_type=event.event_type,
+                        source_link=event.source_permalink or "",
+                        priority="medium",
+                        created_at=created_at,
+                    ))
+        
+        return risks, decisions, actions
+    
+    def _step3_extract_actions(
+        self,
+        event_actions: list[ActionItem],
+        team_analyses: dict[str, TeamAnalysis],
+    ) -> list[ActionItem]:
+        """Step 3: Combine event-derived action items with team analyses' items."""
+        actions = list(event_actions)
         
         # Add action items from team analyses
         for ta in team_analyses.values():
@@ -346,26 +447,22 @@ class DigestOrchestrator:
     
     def _create_global_digest(
         self,
-        events: list[StructuredEvent],
-        dependencies: list[Dependency],
+        date: str,
+        risks: list[Blocker],
+        decisions: list[Decision],
+        total_events: int,
         highlights: list[str],
         cross_team_alerts: list[CrossTeamAlert] = None,
     ) -> GlobalDigest:
         """Create the global org-wide digest with cross-team alerts."""
-        # Get org-wide risks (high urgency blockers)
-        risks = [e for e in events if isinstance(e, Blocker) and e.urgency == "high"]
-        
-        # Get notable decisions
-        decisions = [e for e in events if isinstance(e, Decision)]
-        
-        # Combine highlights with graph highlights
-        all_highlights = highlights + self.dep_graph.get_cross_team_highlights()
+        # Combine highlights with graph highlights, streamed without concatenating
+        all_highlights = chain(highlights, self.dep_graph.get_cross_team_highlights())
         
         return GlobalDigest(
-            date=datetime.now().strftime("%Y-%m-%d"),
-            cross_team_highlights=list(set(all_highlights))[:5],
+            date=date,
+            cross_team_highlights=_dedup_take(all_highlights, 5),
             org_wide_risks=risks[:5],
             notable_decisions=decisions[:5],
             cross_team_alerts=cross_team_alerts or [],
-            total_events=len(events),
+            total_events=total_events,
         )
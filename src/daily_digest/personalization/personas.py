@@ -1,8 +1,16 @@
 """Personas - role-level and team-level personalization preferences."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
+
+
+@lru_cache(maxsize=256)
+def _lower_all(topics: tuple[str, ...]) -> tuple[str, ...]:
+    """Lowercased topics, computed once per distinct topic list."""
+    return tuple(topic.lower() for topic in topics)
 
 
 class PersonaType(str, Enum):
@@ -29,13 +37,13 @@ class Persona:
     name: str
     
     # Item type boosting (item_type -> multiplier, 1.0 = no change)
-    item_boosts: dict[str, float] = field(default_factory=dict)
+    item_boosts: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
     
     # Cross-team sensitivity (0-1, higher = more interested in cross-team items)
     cross_team_weight: float = 0.5
     
     # Topics that increase relevance for this persona
-    topics_of_interest: list[str] = field(default_factory=list)
+    topics_of_interest: Sequence[str] = ()
     
     # Minimum severity to include in main digest ("low", "medium", "high")
     min_severity_for_main: str = "medium"
@@ -44,10 +52,20 @@ class Persona:
         """Get boost multiplier for an item type."""
         return self.item_boosts.get(item_type, 1.0)
     
+    def lowered_topics(self) -> tuple[str, ...]:
+        """topics_of_interest lowercased, in the same order (cached)."""
+        return _lower_all(tuple(self.topics_of_interest))
+    
     def matches_topic(self, text: str) -> bool:
         """Check if text matches any topic of interest."""
-        text_lower = text.lower()
-        return any(topic.lower() in text_lower for topic in self.topics_of_interest)
+        return self.matches_topic_lower(text.lower())
+    
+    def matches_topic_lower(self, text_lower: str) -> bool:
+        """matches_topic for text the caller has already lowercased."""
+        for topic in self.lowered_topics():
+            if topic in text_lower:
+                return True
+        return False
 
 
 # =============================================================================
@@ -60,31 +78,31 @@ class RolePersona:
     LEAD = Persona(
         persona_type=PersonaType.ROLE,
         name="lead",
-        item_boosts={
+        item_boosts=MappingProxyType({
             "blocker": 1.5,      # Leads care a lot about blockers
             "decision": 1.4,    # Decisions need visibility
             "action_item": 1.2,
             "update": 0.9,      # General updates less critical
-        },
+        }),
         cross_team_weight=0.9,  # Very interested in cross-team coordination
-        topics_of_interest=[
+        topics_of_interest=(
             "risk", "timeline", "deadline", "blocked", "decision",
             "escalate", "priority", "sprint", "release", "demo"
-        ],
+        ),
         min_severity_for_main="low",  # Leads see everything
     )
     
     IC = Persona(
         persona_type=PersonaType.ROLE,
         name="ic",
-        item_boosts={
+        item_boosts=MappingProxyType({
             "blocker": 1.3,
             "decision": 1.1,
             "action_item": 1.4,  # ICs care about their tasks
             "update": 1.0,
-        },
+        }),
         cross_team_weight=0.5,  # Moderate cross-team interest
-        topics_of_interest=[],  # Filled by team persona
+        topics_of_interest=(),  # Filled by team persona
         min_severity_for_main="medium",
     )
     
@@ -111,14 +129,14 @@ class TeamPersona:
     MECHANICAL = Persona(
         persona_type=PersonaType.TEAM,
         name="mechanical",
-        item_boosts={
+        item_boosts=MappingProxyType({
             "blocker": 1.2,
             "decision": 1.1,
             "action_item": 1.1,
             "update": 1.0,
-        },
+        }),
         cross_team_weight=0.6,  # Often needs to sync with electrical
-        topics_of_interest=[
+        topics_of_interest=(
             # Design/Engineering
             "FEA", "CAD", "STEP", "DXF", "simulation", "stress", "tolerances",
             "GD&T", "surface finish", "Ra", "fillet", "rib", "wall thickness",
@@ -131,21 +149,21 @@ class TeamPersona:
             "bracket", "housing", "mount", "chassis", "hinge", "actuator",
             # Suppliers
             "vendor", "supplier", "lead time", "expedite",
-        ],
+        ),
         min_severity_for_main="medium",
     )
     
     ELECTRICAL = Persona(
         persona_type=PersonaType.TEAM,
         name="electrical",
-        item_boosts={
+        item_boosts=MappingProxyType({
             "blocker": 1.3,  # EE blockers often affect others
             "decision": 1.1,
             "action_item": 1.1,
             "update": 1.0,
-        },
+        }),
         cross_team_weight=0.7,  # Interfaces with mech (physical) and SW (firmware)
-        topics_of_interest=[
+        topics_of_interest=(
             # PCB Design
             "PCB", "schematic", "layout", "DRC", "rev", "Rev C", "Rev B",
             "copper pour", "via", "trace", "component", "BOM",
@@ -156,21 +174,21 @@ class TeamPersona:
             "stress test", "burn-in", "brown-out", "power-good", "sequencing",
             # Integration
             "firmware", "interface", "connector", "board outline", "keepout",
-        ],
+        ),
         min_severity_for_main="medium",
     )
     
     SOFTWARE = Persona(
         persona_type=PersonaType.TEAM,
         name="software",
-        item_boosts={
+        item_boosts=MappingProxyType({
             "blocker": 1.2,
             "decision": 1.2,  # Architecture decisions important
             "action_item": 1.1,
             "update": 0.9,
-        },
+        }),
         cross_team_weight=0.5,  # Usually more encapsulated
-        topics_of_interest=[
+        topics_of_interest=(
             # Development
             "PR", "code review", "merge", "branch", "deploy", "release",
             "staging", "production", "API", "endpoint", "cache",
@@ -178,16 +196,16 @@ class TeamPersona:
             "latency", "P99", "memory", "CPU", "monitoring", "metrics",
             # Integration  
             "firmware", "algorithm", "integration", "interface",
-        ],
+        ),
         min_severity_for_main="medium",
     )
     
     GENERAL = Persona(
         persona_type=PersonaType.TEAM,
         name="general",
-        item_boosts={},
+        item_boosts=MappingProxyType({}),
         cross_team_weight=0.5,
-        topics_of_interest=[],
+        topics_of_interest=(),
         min_severity_for_main="medium",
     )
     
@@ -211,6 +229,34 @@ class TeamPersona:
 # Persona Manager
 # =============================================================================
 
+@lru_cache(maxsize=256)
+def _combined_persona(
+    role: str,
+    team: str,
+    custom_topics: tuple[str, ...],
+    custom_boosts: tuple[tuple[str, float], ...],
+) -> Persona:
+    """Merge role, team and custom preferences (cached; callers must copy)."""
+    role_persona = RolePersona.get(role)
+    team_persona = TeamPersona.get(team)
+    
+    # Combine item boosts (role is base, custom overrides)
+    combined_boosts = dict(role_persona.item_boosts)
+    combined_boosts.update(custom_boosts)
+    
+    # Combine topics (team + custom)
+    combined_topics = tuple(team_persona.topics_of_interest) + custom_topics
+    
+    return Persona(
+        persona_type=PersonaType.ROLE,  # Combined behaves as role-level
+        name=f"{role}_{team}",
+        item_boosts=MappingProxyType(combined_boosts),
+        cross_team_weight=role_persona.cross_team_weight,
+        topics_of_interest=combined_topics,
+        min_severity_for_main=role_persona.min_severity_for_main,
+    )
+
+
 @dataclass
 class UserPersonaConfig:
     """User's persona configuration."""
@@ -271,30 +317,19 @@ class PersonaManager:
         - cross_team_weight: Role persona (leads care more)
         - topics_of_interest: Team persona + custom topics
         - min_severity_for_main: Role persona
+        
+        Each call returns a new Persona; its boosts and topics are read-only
+        and shared with other users of the same configuration.
         """
         config = self.get_user_config(user_id)
         
         role = role_override or config.role
         team = team_override or config.team
         
-        role_persona = RolePersona.get(role)
-        team_persona = TeamPersona.get(team)
-        
-        # Combine item boosts (role is base, custom overrides)
-        combined_boosts = dict(role_persona.item_boosts)
-        combined_boosts.update(config.custom_boosts)
-        
-        # Combine topics (team + custom)
-        combined_topics = list(team_persona.topics_of_interest) + config.custom_topics
-        
-        return Persona(
-            persona_type=PersonaType.ROLE,  # Combined behaves as role-level
-            name=f"{role}_{team}",
-            item_boosts=combined_boosts,
-            cross_team_weight=role_persona.cross_team_weight,
-            topics_of_interest=combined_topics,
-            min_severity_for_main=role_persona.min_severity_for_main,
-        )
+        # Shallow copy of the cached merge, so callers can't change it for others
+        return replace(_combined_persona(
+            role, team, tuple(config.custom_topics), tuple(config.custom_boosts.items())
+        ))
     
     def get_role_persona(self, role: str) -> Persona:
         """Get a role persona directly."""
@@ -254,8 +254,8 @@ class DigestRanker:
         text = f"{item.title} {item.summary}".lower()
         matched = []
         
-        for topic in persona.topics_of_interest:
-            if topic.lower() in text:
+        for topic, lowered in zip(persona.topics_of_interest, persona.lowered_topics()):
+            if lowered in text:
                 matched.append(topic)
         
         if matched:
@@ -0,0 +1,49 @@
+"""Rate limiting for outbound LLM calls."""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket for pacing async callers to a requests-per-minute budget.
+
+    Holds up to `capacity` tokens (default: one minute's worth; never fewer
+    than one) and refills continuously; acquire() waits until a token is
+    available. A rate of 0 or less disables limiting.
+
+    Usage:
+        bucket = AsyncTokenBucket(rate_per_min=60, capacity=4)
+        await bucket.acquire()
+        # make the request
+    """
+
+    def __init__(self, rate_per_min: float, capacity: Optional[float] = None):
+        self.rate_per_sec = rate_per_min / 60
+        # Below one token acquire() could never succeed
+        self.capacity = max(capacity if capacity is not None else rate_per_min, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec
+        )
+        self._updated = now
+
+    async def acquire(self):
+        """Wait for and take one token."""
+        if self.rate_per_sec <= 0:
+            return
+
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_sec)
+                self._refill()
+            self._tokens -= 1
@@ -202,7 +202,7 @@ class DigestEvaluator:
         text = f"{item.title} {item.summary}".lower()
 
         # Check topic matches
-        topic_matches = sum(1 for t in persona.topics_of_interest if t.lower() in text)
+        topic_matches = sum(1 for t in persona.lowered_topics() if t in text)
         topic_score = min(topic_matches / 3, 1.0) * 0.4 if persona.topics_of_interest else 0.5
 
         # Check team match
@@ -1,5 +1,6 @@
 """Slack client wrapper supporting both real and mock clients."""
 
+import asyncio
 import json
 import os
 from datetime import datetime, timedelta
@@ -190,7 +191,9 @@ class RealSlackClient:
             if since_ts:
                 kwargs["oldest"] = since_ts
 
-            response = self.client.conversations_history(**kwargs)
+            # WebClient is blocking; run it off the event loop so channel
+            # fetches gathered by the aggregator actually overlap
+            response = await asyncio.to_thread(self.client.conversations_history, **kwargs)
             return response.get("messages", [])
         except SlackApiError as e:
             print(f"Error fetching history for {channel_id}: {e.response['error']}")
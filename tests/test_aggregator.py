@@ -102,3 +102,70 @@ class TestMessageAggregator:
         assert "Test User 1" in formatted
         assert "Test User 2" in formatted
         assert "Completed the feature" in formatted
+    
+    def test_user_names_looked_up_once(self, aggregator, monkeypatch):
+        """Repeated authors and mentions hit the client once per user."""
+        calls = []
+        lookup = aggregator.client.get_user_name
+        monkeypatch.setattr(
+            aggregator.client, "get_user_name",
+            lambda user_id: (calls.append(user_id), lookup(user_id))[1],
+        )
+        messages = [
+            {"user": "U001", "text": "ping <@U002>", "ts": "1702900000.000000"},
+            {"user": "U001", "text": "again <@U002> <@U001>", "ts": "1702900060.000000"},
+        ]
+        
+        enriched = aggregator._enrich_messages(messages)
+        
+        assert sorted(calls) == ["U001", "U002"]
+        assert enriched[0]["author"] == enriched[1]["author"]
+    
+    @pytest.mark.asyncio
+    async def test_fetch_all_channels_runs_concurrently(self, aggregator, monkeypatch):
+        """Channel fetches overlap, up to MAX_CONCURRENT_FETCHES, and keep config order."""
+        import asyncio
+        
+        running = []
+        peak = []
+        
+        async def fake_history(channel_id, since_ts=None):
+            running.append(channel_id)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(channel_id)
+            return []
+        
+        monkeypatch.setattr(aggregator.client, "get_channel_history", fake_history)
+        results = await aggregator.fetch_all_channels()
+        
+        assert max(peak) == 3
+        assert [r.team_name for r in results] == ["mechanical", "electrical", "software"]
+        
+        monkeypatch.setattr(MessageAggregator, "MAX_CONCURRENT_FETCHES", 1)
+        peak.clear()
+        await aggregator.fetch_all_channels()
+        assert max(peak) == 1
+    
+    def test_enrich_messages_keeps_raw_by_reference(self, aggregator):
+        """Enriched messages carry only the fields downstream uses, plus the original payload."""
+        msg = {
+            "user": "U001", "text": "hi <@U002>", "ts": "1702900000.000000",
+            "blocks": [{"type": "rich_text"}], "reactions": [{"name": "eyes"}],
+        }
+        
+        [enriched] = aggregator._enrich_messages([msg])
+        
+        assert set(enriched) == {"user", "ts", "author", "text", "timestamp", "raw"}
+        assert enriched["raw"] is msg
+        assert enriched["text"] != msg["text"]
+    
+    def test_enriched_timestamp_is_minute_precision(self, aggregator):
+        """Enriched timestamps match the LLM format's minute-precision local ISO prefix."""
+        from datetime import datetime
+        
+        ts = "1702900123.456789"
+        [enriched] = aggregator._enrich_messages([{"user": "U001", "text": "hi", "ts": ts}])
+        
+        assert enriched["timestamp"] == datetime.fromtimestamp(float(ts)).isoformat()[:16]
+        assert enriched["ts"] == ts
@@ -0,0 +1,143 @@
+"""Tests for the feedback store and prompt enhancer."""
+
+from datetime import datetime
+
+import pytest
+
+from daily_digest.feedback import FeedbackStore, PromptEnhancer
+from daily_digest.feedback.feedback_store import DigestItem, FeedbackEvent
+
+
+@pytest.fixture
+def store(tmp_path):
+    """FeedbackStore backed by a throwaway database."""
+    return FeedbackStore(db_path=str(tmp_path / "feedback.db"))
+
+
+class TestFeedbackStore:
+    """Tests for FeedbackStore directive persistence."""
+
+    def test_add_directives_batch(self, store):
+        """Batch add should insert new directives and reconfirm existing ones."""
+        store.add_directive("mechanical", "Rule A")
+
+        written = store.add_directives("mechanical", ["Rule A", "Rule B"])
+
+        assert written == 2
+        directives = store.get_active_directives("mechanical")
+        # Rule A has two confirmations so it ranks first
+        assert directives == ["Rule A", "Rule B"]
+
+    def test_add_directives_empty(self, store):
+        """Empty batch is a no-op."""
+        assert store.add_directives("mechanical", []) == 0
+        assert store.get_active_directives("mechanical") == []
+
+    def test_active_directives_keyword_filter_applies_before_limit(self, store):
+        """Keyword filtering happens in the query, so the limit cannot hide matches."""
+        generic = ["Generic rule 0", "Generic rule 1", "Generic rule 2"]
+        store.add_directives("software", generic)
+        store.add_directives("software", generic)
+        store.add_directive("software", "Only flag a BLOCKER with clear blocking language.")
+
+        unfiltered = store.get_active_directives("software", max_count=2)
+        assert all(d.startswith("Generic") for d in unfiltered)
+        assert store.get_active_directives("software", max_count=2, keywords=["blocker"]) == [
+            "Only flag a BLOCKER with clear blocking language.",
+        ]
+
+
+class TestPromptEnhancer:
+    """Tests for PromptEnhancer directive formatting."""
+
+    def test_wrong_blockers_generate_directives(self, store):
+        """Repeated 'wrong' feedback on blockers yields blocker and severity rules."""
+        for i in range(2):
+            item = DigestItem(
+                digest_item_id=f"blocker_{i}",
+                run_id="run",
+                date=datetime.now().strftime("%Y-%m-%d"),
+                team="mechanical",
+                item_type="blocker",
+                title=f"Blocker {i}",
+                summary="",
+            )
+            store.store_digest_item(item)
+            store.store_feedback(FeedbackEvent(
+                digest_item_id=item.digest_item_id,
+                user_id=f"U{i}",
+                team="mechanical",
+                feedback_type="wrong",
+            ))
+        enhancer = PromptEnhancer(store)
+
+        directives = enhancer.generate_directives("mechanical")
+
+        assert PromptEnhancer.DIRECTIVE_TEMPLATES["wrong_blocker"] in directives
+        assert PromptEnhancer.DIRECTIVE_TEMPLATES["wrong_severity"] in directives
+        assert PromptEnhancer.DIRECTIVE_TEMPLATES["wrong_decision"] not in directives
+
+    def test_prompt_instructions_filtered_by_item_type(self, store):
+        """Only directives matching the item type keywords are injected."""
+        store.add_directive("software", "Only flag a Blocker with clear blocking language.")
+        store.add_directive("software", "Name the approver for each decision.")
+        enhancer = PromptEnhancer(store)
+
+        instructions = enhancer.get_prompt_instructions(team="software", item_type="blocker")
+
+        assert "Blocker" in instructions
+        assert "approver" not in instructions
+
+    def test_prompt_instructions_unknown_type_returns_all(self, store):
+        """Unknown item types skip filtering."""
+        store.add_directive("software", "Rule A")
+        enhancer = PromptEnhancer(store)
+
+        assert "- Rule A" in enhancer.get_prompt_instructions(team="software", item_type="risk")
+
+    def test_prompt_instructions_cached_until_write(self, store):
+        """Repeat calls are served from cache; confirming a directive invalidates it."""
+        store.add_directive("software", "Rule A")
+        enhancer = PromptEnhancer(store)
+        first = enhancer.get_prompt_instructions(team="software")
+
+        # Writes that bypass the enhancer are not visible until the cache is invalidated
+        store.add_directive("software", "Rule B")
+        assert enhancer.get_prompt_instructions(team="software") == first
+
+        enhancer.confirm_directive("software", "Rule C")
+        refreshed = enhancer.get_prompt_instructions(team="software")
+        assert "- Rule B" in refreshed
+        assert "- Rule C" in refreshed
+
+    def test_prefetch_result_used_by_next_call(self, store):
+        """A prefetched read is consumed by the next matching call."""
+        store.add_directive("software", "Rule A")
+        enhancer = PromptEnhancer(store)
+
+        enhancer.prefetch("software")
+        assert ("software", "") in enhancer._pending
+
+        assert "- Rule A" in enhancer.get_prompt_instructions(team="software")
+        assert enhancer._pending == {}
+
+    def test_shared_enhancer_is_thread_safe(self, store, monkeypatch):
+        """Concurrent callers sharing one enhancer never corrupt the LRU cache."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(PromptEnhancer, "PROMPT_CACHE_SIZE", 2)
+        teams = [f"team{i}" for i in range(6)]
+        for team in teams:
+            store.add_directive(team, f"Rule for {team}")
+        enhancer = PromptEnhancer(store)
+
+        def read(i):
+            team = teams[i % len(teams)]
+            enhancer.prefetch(team)
+            return team, enhancer.get_prompt_instructions(team=team)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(read, range(300)))
+
+        assert all(f"- Rule for {team}" in text for team, text in results)
+        assert len(enhancer._prompt_cache) <= 2
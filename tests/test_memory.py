@@ -0,0 +1,341 @@
+"""Tests for the memory module (dependency graph and memory store)."""
+
+import pytest
+
+from daily_digest.memory import DependencyGraph, MemoryStore
+from daily_digest.models.dependencies import Dependency, DependencyType
+from daily_digest.models.events import Blocker, Decision, EventType
+
+
+def make_blocker(issue, team="electrical"):
+    return Blocker(
+        event_type=EventType.BLOCKER, summary=issue, confidence=0.9,
+        source_channel="C1", source_message_ts="1", teams_involved=[team],
+        issue=issue, owner="Bo", severity="high",
+    )
+
+
+def make_dep(from_team, to_team, urgency="medium", dep_type=DependencyType.WAITING_ON, what="change"):
+    return Dependency(
+        dependency_type=dep_type,
+        from_team=from_team,
+        to_team=to_team,
+        what_changed=what,
+        why_it_matters="impact",
+        recommended_action="sync",
+        suggested_owner="owner",
+        urgency=urgency,
+    )
+
+
+@pytest.fixture
+def graph(tmp_path):
+    return DependencyGraph(data_dir=str(tmp_path))
+
+
+class TestDependencyGraph:
+    """Tests for DependencyGraph queries and persistence."""
+
+    def test_add_and_query(self, graph):
+        """Edges are returned as dicts and filtered by team and direction."""
+        graph.add_dependencies_bulk([
+            make_dep("mechanical", "electrical", urgency="high"),
+            make_dep("software", "electrical"),
+            make_dep("software", "mechanical"),
+        ])
+
+        assert graph.nodes == {"mechanical", "electrical", "software"}
+        assert [e["from_team"] for e in graph.get_dependencies_for_team("electrical", "to")] == [
+            "mechanical", "software",
+        ]
+        assert len(graph.get_dependencies_for_team("software", "from")) == 2
+        assert len(graph.get_dependencies_for_team("mechanical")) == 2
+
+        high = graph.get_high_urgency_dependencies()
+        assert len(high) == 1
+        assert high[0]["what_changed"] == "change"
+        assert high[0]["type"] == "waiting_on"
+        assert high[0]["resolved"] is False
+
+    def test_bulk_add_saves_once(self, graph, monkeypatch):
+        """Bulk inserts write the graph file once, not once per edge."""
+        saves = []
+        monkeypatch.setattr(graph, "_save_graph", lambda: saves.append(1))
+
+        edge_ids = graph.add_dependencies_bulk([
+            make_dep("mechanical", "electrical"),
+            make_dep("software", "electrical"),
+            make_dep("software", "mechanical"),
+        ])
+
+        assert len(edge_ids) == 3
+        assert len(saves) == 1
+        assert graph.add_dependencies_bulk([]) == []
+        assert len(saves) == 1
+
+    def test_resolve_excludes_from_active(self, graph):
+        """Resolved edges drop out of every active query."""
+        edge_id = graph.add_dependency(make_dep("mechanical", "electrical", urgency="high"))
+        graph.add_dependency(make_dep("software", "electrical"))
+
+        assert graph.resolve_dependency(edge_id)
+        assert not graph.resolve_dependency("missing")
+
+        assert len(graph.get_active_dependencies()) == 1
+        assert graph.get_high_urgency_dependencies() == []
+        assert graph.get_dependencies_for_team("mechanical") == []
+        assert graph.get_team_dependency_count() == {"software": {"waiting_on": 1}}
+
+    def test_persistence_round_trip(self, graph, tmp_path):
+        """Edges written by one instance are loaded unchanged by the next."""
+        edge_id = graph.add_dependency(make_dep("mechanical", "electrical"))
+        graph.add_dependency(make_dep("software", "electrical", dep_type=DependencyType.BLOCKING))
+        graph.resolve_dependency(edge_id)
+
+        reloaded = DependencyGraph(data_dir=str(tmp_path))
+
+        assert reloaded.edges == graph.edges
+        assert reloaded.edges[0]["resolved_at"]
+        assert reloaded.nodes == graph.nodes
+
+    def test_cross_team_highlights(self, graph):
+        """High urgency edges come first, then team pairs with repeated dependencies."""
+        graph.add_dependencies_bulk([
+            make_dep("mechanical", "electrical", urgency="high", what="bracket moved"),
+            make_dep("electrical", "mechanical"),
+            make_dep("software", "electrical"),
+        ])
+
+        assert graph.get_cross_team_highlights() == [
+            "🚨 mechanical ↔ electrical: bracket moved",
+            "📊 electrical & mechanical have 2 active dependencies",
+        ]
+
+    def test_highlights_cached_until_graph_changes(self, graph, monkeypatch):
+        """Highlights are rebuilt only after an edge is added or resolved."""
+        edge_id = graph.add_dependency(make_dep("mechanical", "electrical", urgency="high"))
+        builds = []
+        build = graph._build_highlights
+        monkeypatch.setattr(graph, "_build_highlights", lambda n: (builds.append(n), build(n))[1])
+
+        first = graph.get_cross_team_highlights()
+        first.append("caller-owned")
+        assert graph.get_cross_team_highlights() == first[:1]
+        assert len(builds) == 1
+
+        graph.resolve_dependency(edge_id)
+        assert graph.get_cross_team_highlights() == []
+        assert len(builds) == 2
+
+    def test_edges_view_cached_until_graph_changes(self, graph):
+        """Repeated edges access reuses one list; adds and resolves refresh it."""
+        edge_id = graph.add_dependency(make_dep("mechanical", "electrical"))
+
+        first = graph.edges
+        assert graph.edges is first
+        assert len(graph) == 1
+
+        graph.add_dependency(make_dep("software", "electrical"))
+        assert len(graph.edges) == len(graph) == 2
+
+        graph.resolve_dependency(edge_id)
+        assert graph.edges[0]["resolved"] is True
+        # Re-resolving rewrites resolved_at, so the view is rebuilt too
+        before = graph.edges
+        graph.resolve_dependency(edge_id)
+        assert graph.edges is not before
+
+
+class TestMemoryStore:
+    """Tests for MemoryStore persistence."""
+
+    def test_state_round_trip(self, tmp_path):
+        """Decisions and blockers written by one store are loaded by the next."""
+        store = MemoryStore(data_dir=str(tmp_path))
+        store.log_decision(Decision(
+            event_type=EventType.DECISION, summary="Use rev B", confidence=0.9,
+            source_channel="C1", source_message_ts="1", teams_involved=["electrical"],
+            what_decided="Use rev B board", decided_by="Ana",
+        ))
+        blocker_id = store.log_blocker(make_blocker("PCB late"))
+        store.flush()
+
+        reloaded = MemoryStore(data_dir=str(tmp_path))
+
+        assert reloaded.decisions == store.decisions
+        assert [b["blocker_id"] for b in reloaded.get_open_blockers("electrical")] == [blocker_id]
+        assert reloaded.resolve_blocker(blocker_id)
+        reloaded.flush()
+        assert MemoryStore(data_dir=str(tmp_path)).get_open_blockers() == []
+
+    def test_process_events_appends_each_log_once(self, tmp_path, monkeypatch):
+        """Bulk event processing defers appends and writes each changed log once."""
+        store = MemoryStore(data_dir=str(tmp_path))
+        flushes = []
+        flush = store.flush
+        monkeypatch.setattr(store, "flush", lambda: (flushes.append(1), flush()))
+
+        results = store.process_events([make_blocker(f"b{i}") for i in range(5)])
+
+        assert results["blockers_logged"] == 5
+        assert len(flushes) == 1
+        assert len((tmp_path / "blockers.jsonl").read_bytes().splitlines()) == 5
+        assert not (tmp_path / "decisions.jsonl").exists()
+        assert len(MemoryStore(data_dir=str(tmp_path)).blockers) == 5
+
+    def test_updates_are_appended_and_folded(self, tmp_path):
+        """Resolving appends an update line that is applied on reload, then compacted away."""
+        store = MemoryStore(data_dir=str(tmp_path))
+        blocker_id = store.log_blocker(make_blocker("PCB late"))
+        store.resolve_blocker(blocker_id)
+        store.flush()
+
+        log = tmp_path / "blockers.jsonl"
+        assert len(log.read_bytes().splitlines()) == 2
+
+        reloaded = MemoryStore(data_dir=str(tmp_path))
+        assert reloaded.blockers[0]["status"] == "resolved"
+        assert reloaded.blockers[0]["resolved_at"]
+        # One update vs one record: not yet worth compacting
+        assert len(log.read_bytes().splitlines()) == 2
+
+        reloaded.compact()
+        assert len(log.read_bytes().splitlines()) == 1
+        assert MemoryStore(data_dir=str(tmp_path)).blockers == reloaded.blockers
+
+    def test_process_events_reads_clock_once(self, tmp_path, monkeypatch):
+        """Every event in a batch shares one timestamp, and IDs stay unique."""
+        from daily_digest.memory import store as store_module
+
+        calls = []
+        real_datetime = store_module.datetime
+
+        class CountingDatetime(real_datetime):
+            @classmethod
+            def now(cls, tz=None):
+                calls.append(1)
+                return real_datetime.now(tz)
+
+        monkeypatch.setattr(store_module, "datetime", CountingDatetime)
+        store = MemoryStore(data_dir=str(tmp_path))
+
+        store.process_events([make_blocker(f"b{i}") for i in range(4)])
+
+        assert len(calls) == 1
+        assert len({b["created_at"] for b in store.blockers}) == 1
+        assert len({b["blocker_id"] for b in store.blockers}) == 4
+
+    def test_recent_decisions_use_parsed_timestamps(self, tmp_path):
+        """Recent-decision queries filter by age and team, skipping bad timestamps."""
+        (tmp_path / "decisions.jsonl").write_text(
+            '{"decision_id": "dec_0", "team": "software", "timestamp": "2000-01-01T00:00:00"}\n'
+            '{"decision_id": "dec_1", "team": "software", "timestamp": "not a date"}\n'
+        )
+        store = MemoryStore(data_dir=str(tmp_path))
+        store.log_decision(Decision(
+            event_type=EventType.DECISION, summary="Use rev B", confidence=0.9,
+            source_channel="C1", source_message_ts="1", teams_involved=["electrical"],
+            what_decided="Use rev B board", decided_by="Ana",
+        ))
+
+        assert [d["team"] for d in store.get_recent_decisions()] == ["electrical"]
+        assert store.get_recent_decisions(team="software") == []
+        assert len(store.get_recent_decisions(days=365 * 100)) == 2
+
+    def test_recent_decisions_with_out_of_order_log(self, tmp_path):
+        """A log whose timestamps are not ascending is still filtered correctly."""
+        (tmp_path / "decisions.jsonl").write_text(
+            '{"decision_id": "dec_0", "team": "software", "timestamp": "2999-01-01T00:00:00"}\n'
+            '{"decision_id": "dec_1", "team": "software", "timestamp": "2000-01-01T00:00:00"}\n'
+        )
+        store = MemoryStore(data_dir=str(tmp_path))
+
+        assert [d["decision_id"] for d in store.get_recent_decisions()] == ["dec_0"]
+
+    def test_migrates_legacy_json_array(self, tmp_path):
+        """A pre-JSONL decisions.json array is loaded and rewritten as a log."""
+        (tmp_path / "decisions.json").write_text(
+            '[{"decision_id": "dec_0", "summary": "old", "team": "software", "timestamp": "2024-01-01T00:00:00"}]'
+        )
+
+        store = MemoryStore(data_dir=str(tmp_path))
+
+        assert [d["decision_id"] for d in store.decisions] == ["dec_0"]
+        assert (tmp_path / "decisions.jsonl").exists()
+        assert MemoryStore(data_dir=str(tmp_path)).decisions == store.decisions
+
+    def test_batched_appends_are_buffered_until_limit(self, tmp_path, monkeypatch):
+        """Inside batch(), log calls stay in memory until the buffer fills."""
+        monkeypatch.setattr(MemoryStore, "BUFFER_LIMIT", 3)
+        store = MemoryStore(data_dir=str(tmp_path))
+        log = tmp_path / "blockers.jsonl"
+
+        with store.batch():
+            store.log_blocker(make_blocker("a"))
+            store.log_blocker(make_blocker("b"))
+            assert not log.exists()
+            assert len(store.get_open_blockers()) == 2
+
+            store.log_blocker(make_blocker("c"))
+            assert len(log.read_bytes().splitlines()) == 3
+
+    def test_single_calls_are_written_immediately(self, tmp_path):
+        """A log call outside batch() reaches disk before it returns."""
+        store = MemoryStore(data_dir=str(tmp_path))
+        blocker_id = store.log_blocker(make_blocker("a"))
+        store.resolve_blocker(blocker_id)
+
+        assert MemoryStore(data_dir=str(tmp_path)).get_open_blockers() == []
+        assert len(MemoryStore(data_dir=str(tmp_path)).blockers) == 1
+
+    def test_dropped_store_flushes_buffer(self, tmp_path):
+        """Lines still buffered when a store is collected are written, not lost."""
+        import gc
+
+        def log_and_drop():
+            store = MemoryStore(data_dir=str(tmp_path))
+            with store.batch():
+                store.log_blocker(make_blocker("a"))
+                # Abandon the batch without its exit-time flush
+                store._batch_depth += 1
+
+        log_and_drop()
+        gc.collect()
+
+        assert len(MemoryStore(data_dir=str(tmp_path)).blockers) == 1
+
+    def test_resolve_and_complete_by_id(self, tmp_path):
+        """Blockers and actions are found by ID, including ones loaded from disk."""
+        from daily_digest.models.events import ActionItem
+
+        store = MemoryStore(data_dir=str(tmp_path))
+        first = store.log_blocker(make_blocker("a"))
+        action_id = store.log_action(ActionItem(
+            description="Send drawings", owner="Ana",
+            source_event_type=EventType.DECISION, source_link="",
+        ))
+        store.flush()
+
+        reloaded = MemoryStore(data_dir=str(tmp_path))
+        second = reloaded.log_blocker(make_blocker("b"))
+
+        assert reloaded.resolve_blocker(first, status="mitigated")
+        assert reloaded.resolve_blocker(second)
+        assert not reloaded.resolve_blocker("blk_missing")
+        assert reloaded.get_open_blockers() == []
+        assert reloaded.complete_action(action_id)
+        assert not reloaded.complete_action("act_missing")
+        assert reloaded.get_open_actions() == []
+
+    def test_open_blockers_keep_log_order(self, tmp_path):
+        """Open blockers come back in log order, including after a re-open."""
+        store = MemoryStore(data_dir=str(tmp_path))
+        ids = [store.log_blocker(make_blocker(issue)) for issue in ("a", "b", "c")]
+
+        store.resolve_blocker(ids[0])
+        store.resolve_blocker(ids[1], status="mitigated")
+        assert [b["issue"] for b in store.get_open_blockers()] == ["c"]
+
+        store.resolve_blocker(ids[0], status="active")
+        assert [b["issue"] for b in store.get_open_blockers()] == ["a", "c"]
+        assert store.get_open_blockers(team="software") == []
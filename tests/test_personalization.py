@@ -71,6 +71,8 @@ class TestPersona:
         assert persona.matches_topic("Power supply issue")
         assert persona.matches_topic("THERMAL simulation complete")  # Case insensitive
         assert not persona.matches_topic("CNC machine status")
+        assert persona.matches_topic_lower("thermal simulation complete")
+        assert not persona.matches_topic_lower("THERMAL simulation complete")  # Caller lowercases
 
 
 class TestRolePersona:
@@ -176,6 +178,39 @@ class TestPersonaManager:
         # Should have both team topics and custom topics
         assert "PCB" in combined.topics_of_interest
         assert "custom_topic" in combined.topics_of_interest
+    
+    def test_combined_persona_is_shared_per_configuration(self):
+        """Identical configurations share one merge, but each caller gets its own persona."""
+        manager = PersonaManager()
+        manager.set_user_persona("U_A", role="lead", team="mechanical")
+        manager.set_user_persona("U_B", role="lead", team="mechanical")
+        manager.set_user_persona("U_C", role="lead", team="mechanical", custom_topics=["hinge"])
+        
+        combined = manager.get_combined_persona("U_A")
+        other = manager.get_combined_persona("U_B")
+        
+        assert other == combined and other is not combined
+        assert other.item_boosts is combined.item_boosts
+        assert manager.get_combined_persona("U_C") != combined
+        assert manager.get_combined_persona("U_A", team_override="software").name == "lead_software"
+        
+        # Changing one caller's copy leaves the next caller's untouched
+        combined.cross_team_weight = 0.0
+        assert manager.get_combined_persona("U_B").cross_team_weight == RolePersona.LEAD.cross_team_weight
+    
+    def test_shared_personas_are_read_only(self):
+        """Predefined and combined personas cannot be mutated through their fields."""
+        manager = PersonaManager()
+        manager.set_user_persona("U_A", role="lead", team="mechanical", custom_boosts={"update": 2.0})
+        combined = manager.get_combined_persona("U_A")
+        
+        assert combined.get_item_boost("update") == 2.0
+        with pytest.raises(TypeError):
+            combined.item_boosts["blocker"] = 3.0
+        with pytest.raises(TypeError):
+            RolePersona.LEAD.item_boosts["blocker"] = 3.0
+        assert isinstance(TeamPersona.MECHANICAL.topics_of_interest, tuple)
+        assert RolePersona.LEAD.get_item_boost("update") == 0.9
 
 
 # =============================================================================
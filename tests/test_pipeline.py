@@ -168,6 +168,45 @@ class TestDigestFormatter:
         assert isinstance(dm, str)
         assert "Executive Digest" in dm
         assert "software" in dm.lower()
+    
+    def test_item_blocks_wrap_section_text(self, formatter, sample_team_analysis):
+        """Item blocks are the item's section followed by the feedback guide."""
+        high, low, excluded = formatter.format_digest_items(
+            {"software": sample_team_analysis}, "run1"
+        )
+        
+        assert high and not low and not excluded
+        for msg in high:
+            section, guide = msg.blocks
+            assert section["text"]["text"] == msg.section_text
+            assert formatter.FEEDBACK_GUIDE in guide["elements"][0]["text"]
+    
+    def test_main_digest_key_blockers(self, formatter, sample_output, sample_team_analysis):
+        """Key blockers are active and either high severity or mention another team."""
+        sample_team_analysis.blockers = [
+            {"issue": "Waiting on FIRMWARE drop", "severity": "low", "status": "active"},
+            {"issue": "Flaky CI", "severity": "medium", "status": "active"},
+            {"issue": "Old electrical issue", "severity": "high", "status": "resolved"},
+        ]
+        
+        _, blocks = formatter.format_main_digest(sample_output, sample_output.team_analyses)
+        
+        texts = "\n".join(b["text"]["text"] for b in blocks if b.get("type") == "section")
+        assert "🟡 *[software]* Waiting on FIRMWARE drop" in texts
+        assert "Flaky CI" not in texts
+        assert "Old electrical issue" not in texts
+    
+    def test_main_digest_summary_truncation(self, formatter, sample_output, sample_team_analysis):
+        """Team summaries up to 150 chars are shown as-is; longer ones are cut with an ellipsis."""
+        def team_text():
+            _, blocks = formatter.format_main_digest(sample_output, sample_output.team_analyses)
+            return next(b["text"]["text"] for b in blocks if "*Software*" in b.get("text", {}).get("text", ""))
+        
+        sample_team_analysis.summary = "x" * 150
+        assert team_text().endswith("_" + "x" * 150 + "_")
+        
+        sample_team_analysis.summary = "y" * 151
+        assert team_text().endswith("_" + "y" * 150 + "..._")
 
 
 class TestDigestDistributor:
@@ -330,3 +369,276 @@ class TestMetricsLogger:
         
         assert len(metrics.metrics.failures) == 1
         assert "Test error" in metrics.metrics.failures[0]
+    
+    def test_metrics_to_dict_matches_asdict(self):
+        """to_dict returns every field with independent container copies."""
+        from dataclasses import asdict
+        
+        metrics = MetricsLogger()
+        metrics.record_channel("software", 15, tokens_used=500)
+        metrics.record_agent_duration("extractor", 120)
+        metrics.record_failure("Test error")
+        
+        data = metrics.metrics.to_dict()
+        
+        assert data == asdict(metrics.metrics)
+        data["failures"].clear()
+        assert metrics.metrics.failures == ["Test error"]
+    
+    def test_log_summary_emits_one_record(self, caplog):
+        """The run summary is logged as a single record, at warning level on failure."""
+        import logging
+        
+        metrics = MetricsLogger()
+        metrics.record_channel("software", 15)
+        metrics.record_agent_duration("extractor", 120)
+        
+        with caplog.at_level(logging.INFO, logger="daily_digest"):
+            metrics.log_summary()
+        
+        assert len(caplog.records) == 1
+        assert caplog.records[0].levelno == logging.INFO
+        assert "  - software: 15" in caplog.text
+        assert "Status: SUCCESS" in caplog.text
+        
+        metrics.record_failure("Test error")
+        caplog.clear()
+        metrics.log_summary()
+        
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
+        assert "Failures: 1" in caplog.text
+
+
+class TestAsyncTokenBucket:
+    """Tests for LLM request pacing."""
+    
+    @pytest.mark.asyncio
+    async def test_paces_after_burst(self):
+        """Calls beyond the burst capacity wait for tokens to refill."""
+        import time
+        from daily_digest.rate_limit import AsyncTokenBucket
+        
+        bucket = AsyncTokenBucket(rate_per_min=1200, capacity=2)  # one token per 50ms
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        
+        assert time.monotonic() - start >= 0.09
+    
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_limit(self):
+        """A non-positive rate never waits."""
+        from daily_digest.rate_limit import AsyncTokenBucket
+        
+        bucket = AsyncTokenBucket(rate_per_min=0, capacity=1)
+        for _ in range(100):
+            await bucket.acquire()
+    
+    @pytest.mark.asyncio
+    async def test_zero_capacity_still_admits_calls(self):
+        """A capacity below one token is raised to one instead of deadlocking."""
+        import asyncio
+        from daily_digest.rate_limit import AsyncTokenBucket
+        
+        bucket = AsyncTokenBucket(rate_per_min=60, capacity=0)
+        
+        await asyncio.wait_for(bucket.acquire(), timeout=1)
+        assert bucket.capacity == 1
+    
+    def test_config_rejects_zero_concurrency(self, monkeypatch):
+        """MAX_CONCURRENT_LLM=0 fails fast instead of hanging the run."""
+        monkeypatch.setenv("MAX_CONCURRENT_LLM", "0")
+        
+        with pytest.raises(ValueError, match="MAX_CONCURRENT_LLM"):
+            DigestConfig.from_env()
+
+
+class TestDigestOrchestrator:
+    """Tests for DigestOrchestrator pipeline steps."""
+    
+    @pytest.fixture
+    def orchestrator(self, tmp_path, monkeypatch):
+        """Mock-mode orchestrator with storage under tmp_path."""
+        from daily_digest import orchestrator as orchestrator_module
+        from daily_digest.memory import MemoryStore, DependencyGraph
+        
+        monkeypatch.setattr(
+            orchestrator_module, "MemoryStore", lambda: MemoryStore(data_dir=str(tmp_path))
+        )
+        monkeypatch.setattr(
+            orchestrator_module, "DependencyGraph", lambda: DependencyGraph(data_dir=str(tmp_path))
+        )
+        config = DigestConfig(
+            channels={"mechanical": "C_MECH", "electrical": "C_ELEC", "software": "C_SOFT"},
+        )
+        return DigestOrchestrator(config=config, mock_mode=True)
+    
+    @pytest.mark.asyncio
+    async def test_step1_analyzes_teams_concurrently(self, orchestrator, monkeypatch):
+        """Active teams are analyzed in parallel; results keep channel order."""
+        import threading
+        
+        # Only passes if both active teams' calls are running at the same time
+        barrier = threading.Barrier(2, timeout=5)
+        analyze_team = orchestrator.team_analyzer.analyze_team
+        
+        def concurrent_analyze(*args, **kwargs):
+            barrier.wait()
+            return analyze_team(*args, **kwargs)
+        
+        monkeypatch.setattr(orchestrator.team_analyzer, "analyze_team", concurrent_analyze)
+        message = {"author": "Ana", "text": "Board rev B is blocked on parts", "timestamp": ""}
+        channel_messages = [
+            ChannelMessages("mechanical", "C_MECH", "mechanical", messages=[message]),
+            ChannelMessages("electrical", "C_ELEC", "electrical"),
+            ChannelMessages("software", "C_SOFT", "software", messages=[message]),
+        ]
+        aggregator = MessageAggregator(MagicMock(), orchestrator.config)
+        
+        team_analyses, events_by_team = await orchestrator._step1_analyze_teams(
+            channel_messages, aggregator
+        )
+        
+        assert list(team_analyses) == ["mechanical", "electrical", "software"]
+        assert team_analyses["electrical"].tone == "quiet"
+        assert events_by_team["electrical"] == []
+        assert team_analyses["software"].message_count == 1
+        assert set(orchestrator.metrics.metrics.agent_durations_ms) == {
+            "team_analyzer_mechanical", "team_analyzer_software",
+        }
+    
+    @pytest.mark.asyncio
+    async def test_step3_failure_cancels_dependency_task(self, orchestrator, monkeypatch):
+        """If step 3 raises, the in-flight step 2 task is cancelled rather than orphaned."""
+        import asyncio
+        
+        monkeypatch.setenv("SKIP_FEEDBACK_PROCESSING", "true")
+        monkeypatch.setattr(MessageAggregator, "fetch_all_channels", AsyncMock(return_value=[]))
+        monkeypatch.setattr(
+            orchestrator, "_step1_analyze_teams", AsyncMock(return_value=({}, {"a": [], "b": []}))
+        )
+        step2_started = asyncio.Event()
+        step2_cancelled = asyncio.Event()
+        
+        async def slow_step2(events_by_team):
+            step2_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                step2_cancelled.set()
+                raise
+        
+        def failing_step3(event_actions, team_analyses):
+            assert step2_started.is_set()  # step 2 got going first
+            raise RuntimeError("step 3 failed")
+        
+        monkeypatch.setattr(orchestrator, "_step2_detect_dependencies", slow_step2)
+        monkeypatch.setattr(orchestrator, "_step3_extract_actions", failing_step3)
+        
+        with pytest.raises(RuntimeError, match="step 3 failed"):
+            await orchestrator.run(MagicMock())
+        
+        await asyncio.sleep(0)
+        assert step2_cancelled.is_set()
+    
+    @pytest.mark.asyncio
+    async def test_mock_mode_skips_rate_limit(self, orchestrator, monkeypatch):
+        """Mock runs make no provider calls, so they are never paced."""
+        acquire = AsyncMock()
+        monkeypatch.setattr(orchestrator._llm_bucket, "acquire", acquire)
+        
+        assert await orchestrator._call_llm(lambda x: x + 1, 1) == 2
+        acquire.assert_not_called()
+    
+    def test_global_digest_highlights_keep_order(self, orchestrator):
+        """Highlights are deduplicated in order, linker highlights first, capped at 5."""
+        highlights = ["b", "a", "b", "c", "a", "d", "e", "f"]
+        
+        digest = orchestrator._create_global_digest("2024-12-24", [], [], 0, highlights)
+        
+        assert digest.cross_team_highlights == ["b", "a", "c", "d", "e"]
+    
+    def test_summarize_events_partitions_in_one_pass(self, orchestrator):
+        """Risks, decisions and event-derived actions come out of one walk, in order."""
+        from daily_digest.models.events import Blocker, Decision, EventType
+        
+        def blocker(issue, severity, status="active"):
+            return Blocker(
+                event_type=EventType.BLOCKER, summary=issue, confidence=0.9,
+                source_channel="C1", source_message_ts="", teams_involved=["electrical"],
+                urgency="high" if severity == "high" else "medium",
+                issue=issue, owner="Bo", severity=severity, status=status,
+            )
+        
+        decision = Decision(
+            event_type=EventType.DECISION, summary="Use rev B", confidence=0.9,
+            source_channel="C1", source_message_ts="", teams_involved=["electrical"],
+            what_decided="Use rev B", decided_by="Ana", impact="New footprint",
+        )
+        events = [
+            blocker("PCB late", "high"), decision,
+            blocker("Old issue", "high", status="resolved"), blocker("Slow CI", "low"),
+        ]
+        
+        risks, decisions, actions = orchestrator._summarize_events(events)
+        
+        assert [r.issue for r in risks] == ["PCB late", "Old issue"]
+        assert decisions == [decision]
+        assert [a.description for a in actions] == [
+            "Resolve: PCB late", "Follow up: Use rev B", "Resolve: Slow CI",
+        ]
+        assert actions[0].priority == "high"
+    
+    def test_summarize_events_dispatches_on_class(self, orchestrator):
+        """Only Blocker/Decision instances are partitioned, whatever their type tag says."""
+        from daily_digest.models.events import Decision, EventType, StructuredEvent
+        
+        tagged_only = StructuredEvent(
+            event_type=EventType.BLOCKER, summary="Looks like a blocker", confidence=0.9,
+            source_channel="C1", source_message_ts="", urgency="high",
+        )
+        decision = Decision(
+            event_type=EventType.DECISION, summary="Use rev B", confidence=0.9,
+            source_channel="C1", source_message_ts="", what_decided="Use rev B",
+            decided_by="Ana", impact="New footprint",
+        )
+        # A string tag, as from deserialized data
+        decision.event_type = "decision"
+        
+        risks, decisions, actions = orchestrator._summarize_events([tagged_only, decision])
+        
+        assert risks == []
+        assert decisions == [decision]
+        assert [a.description for a in actions] == ["Follow up: Use rev B"]
+    
+    def test_output_to_json_bytes_matches_to_json(self, orchestrator):
+        """The encoded digest output decodes to the same dict as to_json()."""
+        import json
+        from daily_digest.models.events import Decision, EventType
+        
+        decision = Decision(
+            event_type=EventType.DECISION, summary="Use rev B", confidence=0.9,
+            source_channel="C1", source_message_ts="", teams_involved=["electrical"],
+            what_decided="Use rev B", decided_by="Ana",
+        )
+        digest = orchestrator._create_global_digest("2024-12-24", [], [decision], 1, ["a ↔ b"])
+        output = DigestOutput(global_digest=digest, personalized_digests=[], memory_writes={"decisions": 1})
+        
+        data = output.to_json()
+        
+        assert data["global_digest"]["date"] == "2024-12-24"
+        assert data["global_digest"]["notable_decisions"] == ["Use rev B"]
+        assert json.loads(output.to_json_bytes()) == data
+    
+    def test_output_to_json_omits_quiet_teams(self, orchestrator):
+        """Zero-message placeholder analyses are left out of the serialized output."""
+        digest = orchestrator._create_global_digest("2024-12-24", [], [], 0, [])
+        output = DigestOutput(
+            global_digest=digest, personalized_digests=[], memory_writes={},
+            team_analyses={
+                "mechanical": TeamAnalysis("mechanical", "C_MECH", 3, summary="Busy day"),
+                "electrical": TeamAnalysis("electrical", "C_ELEC", 0, tone="quiet"),
+            },
+        )
+        
+        assert list(output.to_json()["team_analyses"]) == ["mechanical"]